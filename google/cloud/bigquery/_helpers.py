@@ -17,6 +17,7 @@
 import base64
 import datetime
 import decimal
+import functools
 import json
 import math
 import re
@@ -29,7 +30,6 @@ from dateutil import relativedelta
 from google.cloud._helpers import UTC  # type: ignore
 from google.cloud._helpers import _date_from_iso8601_date
 from google.cloud._helpers import _datetime_from_microseconds
-from google.cloud._helpers import _RFC3339_MICROS
 from google.cloud._helpers import _RFC3339_NO_FRACTION
 from google.cloud._helpers import _to_bytes
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -54,7 +54,7 @@ _INTERVAL_PATTERN = re.compile(
     r"(?P<days>-?\d+) "
     r"(?P<time_sign>-?)(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+)\.?(?P<fraction>\d*)?$"
 )
-_RANGE_PATTERN = re.compile(r"\[.*, .*\)")
+_RANGE_PATTERN = re.compile(r"\[([^,]*), ([^,]*)\)\Z")
 
 BIGQUERY_EMULATOR_HOST = "BIGQUERY_EMULATOR_HOST"
 """Environment variable defining host for emulator."""
@@ -134,6 +134,19 @@ def _not_null(value, field):
     return value is not None or (field is not None and field.mode != "NULLABLE")
 
 
+@functools.lru_cache(maxsize=None)
+def _range_element_placeholder_field(element_type):
+    """Build the field used to parse the bounds of a RANGE value.
+
+    Only a handful of element types are supported, so the fields are built
+    once and reused for every bound that is parsed.
+    """
+    # Avoid circular imports by importing here.
+    from google.cloud.bigquery import schema
+
+    return schema.SchemaField("placeholder", element_type)
+
+
 class CellDataParser:
     """Converter from BigQuery REST resource to Python value for RowIterator and similar classes.
 
@@ -330,15 +343,12 @@ class CellDataParser:
 
     def _range_element_to_py(self, value, field_element_type):
         """Coerce 'value' to a range element value."""
-        # Avoid circular imports by importing here.
-        from google.cloud.bigquery import schema
-
         if value == "UNBOUNDED":
             return None
         if field_element_type.element_type in _SUPPORTED_RANGE_ELEMENTS:
             return self.to_py(
                 value,
-                schema.SchemaField("placeholder", field_element_type.element_type),
+                _range_element_placeholder_field(field_element_type.element_type),
             )
         else:
             raise ValueError(
@@ -366,8 +376,9 @@ class CellDataParser:
                 null (otherwise it is :data:`None`).
         """
         if _not_null(value, field):
-            if _RANGE_PATTERN.match(value):
-                start, end = value[1:-1].split(", ")
+            match = _RANGE_PATTERN.match(value)
+            if match is not None:
+                start, end = match.groups()
                 start = self._range_element_to_py(start, field.range_element_type)
                 end = self._range_element_to_py(end, field.range_element_type)
                 return {"start": start, "end": end}
@@ -472,12 +483,22 @@ def _row_tuple_from_json(row, schema):
     """
     from google.cloud.bigquery.schema import _to_schema_fields
 
-    schema = _to_schema_fields(schema)
+    return _row_tuple_from_schema_fields(row, _to_schema_fields(schema))
+
+
+def _row_tuple_from_schema_fields(row, schema):
+    """Convert JSON row data using an already resolved schema.
 
-    row_data = []
-    for field, cell in zip(schema, row["f"]):
-        row_data.append(CELL_DATA_PARSER.to_py(cell["v"], field))
-    return tuple(row_data)
+    Args:
+        row (Dict): A JSON response row to be converted.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            Specification of the field types in ``row``.
+
+    Returns:
+        Tuple: A tuple of data converted to native types.
+    """
+    to_py = CELL_DATA_PARSER.to_py
+    return tuple([to_py(cell["v"], field) for field, cell in zip(schema, row["f"])])
 
 
 def _rows_from_json(values, schema):
@@ -501,7 +522,10 @@ def _rows_from_json(values, schema):
 
     schema = _to_schema_fields(schema)
     field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index) for r in values]
+    # Resolve the schema once for the whole batch rather than once per row.
+    return [
+        Row(_row_tuple_from_schema_fields(r, schema), field_to_index) for r in values
+    ]
 
 
 def _int_to_json(value):
@@ -519,7 +543,12 @@ def _float_to_json(value) -> Union[None, str, float]:
     if isinstance(value, str):
         value = float(value)
 
-    return str(value) if (math.isnan(value) or math.isinf(value)) else float(value)
+    # Convert once: math.isnan() and math.isinf() would otherwise each convert
+    # a non-float value, such as a Decimal, again.
+    as_float = value if type(value) is float else float(value)
+    if math.isnan(as_float) or math.isinf(as_float):
+        return str(value)
+    return as_float
 
 
 def _decimal_to_json(value):
@@ -531,7 +560,8 @@ def _decimal_to_json(value):
 
 def _bool_to_json(value):
     """Coerce 'value' to an JSON-compatible representation."""
-    if isinstance(value, bool):
+    # bool cannot be subclassed, so the exact type check is sufficient.
+    if type(value) is bool:
         value = "true" if value else "false"
     return value
 
@@ -568,25 +598,31 @@ def _timestamp_to_json_parameter(value):
     return value
 
 
+def _utc_datetime_to_micros_str(value):
+    """Format a datetime in UTC as ``YYYY-MM-DDTHH:MM:SS.ffffff``.
+
+    For naive datetime objects UTC timezone is assumed, thus we format those
+    to string directly without conversion.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    if type(value) is datetime.datetime:
+        # Much faster than strftime(), and always zero-pads the year.
+        return value.isoformat(timespec="microseconds")
+    return value.strftime(_RFC3339_MICROS_NO_ZULU)
+
+
 def _timestamp_to_json_row(value):
     """Coerce 'value' to an JSON-compatible representation."""
     if isinstance(value, datetime.datetime):
-        # For naive datetime objects UTC timezone is assumed, thus we format
-        # those to string directly without conversion.
-        if value.tzinfo is not None:
-            value = value.astimezone(UTC)
-        value = value.strftime(_RFC3339_MICROS)
+        value = _utc_datetime_to_micros_str(value) + "Z"
     return value
 
 
 def _datetime_to_json(value):
     """Coerce 'value' to an JSON-compatible representation."""
     if isinstance(value, datetime.datetime):
-        # For naive datetime objects UTC timezone is assumed, thus we format
-        # those to string directly without conversion.
-        if value.tzinfo is not None:
-            value = value.astimezone(UTC)
-        value = value.strftime(_RFC3339_MICROS_NO_ZULU)
+        value = _utc_datetime_to_micros_str(value)
     return value
 
 
@@ -604,6 +640,19 @@ def _time_to_json(value):
     return value
 
 
+@functools.lru_cache(maxsize=4096)
+def _range_date_element_to_json(element_type_name, value):
+    """Format a date or naive datetime RANGE bound, caching repeated values.
+
+    RANGE columns tend to repeat the same bounds across many rows. The cache
+    is bounded so that columns of mostly unique values do not grow it without
+    limit. Aware datetimes must not be passed here: values which compare
+    equal, such as the same instant in different zones or both ``fold``
+    values of an ambiguous wall time, may format differently.
+    """
+    return _RANGE_ELEMENT_TO_JSON[element_type_name](value)
+
+
 def _range_element_to_json(value, element_type=None):
     """Coerce 'value' to an JSON-compatible representation."""
     if value is None:
@@ -615,31 +664,37 @@ def _range_element_to_json(value, element_type=None):
             # We do not enforce range element value to be valid to reduce
             # redundancy with backend.
             return value
-    elif (
-        element_type and element_type.element_type.upper() in _SUPPORTED_RANGE_ELEMENTS
-    ):
-        converter = _SCALAR_VALUE_TO_JSON_ROW.get(element_type.element_type.upper())
-        return converter(value)
-    else:
+
+    converter = None
+    if element_type:
+        element_type_name = element_type.element_type.upper()
+        converter = _RANGE_ELEMENT_TO_JSON.get(element_type_name)
+    if converter is None:
         raise ValueError(
             f"Unsupported RANGE element type {element_type}, or "
             "element type is empty. Must be DATE, DATETIME, or "
             "TIMESTAMP"
         )
 
+    if type(value) is datetime.date or (
+        type(value) is datetime.datetime and value.tzinfo is None
+    ):
+        return _range_date_element_to_json(element_type_name, value)
+    return converter(value)
+
 
 def _range_field_to_json(range_element_type, value):
     """Coerce 'value' to an JSON-compatible representation."""
-    if isinstance(value, str):
-        # string literal
-        if _RANGE_PATTERN.match(value):
-            start, end = value[1:-1].split(", ")
-        else:
-            raise ValueError(f"RANGE literal {value} has incorrect format")
-    elif isinstance(value, dict):
-        # dictionary
+    if isinstance(value, dict):
+        # dictionary, the most common representation
         start = value.get("start")
         end = value.get("end")
+    elif isinstance(value, str):
+        # string literal, "[start, end)"
+        match = _RANGE_PATTERN.match(value)
+        if match is None:
+            raise ValueError(f"RANGE literal {value} has incorrect format")
+        start, end = match.groups()
     else:
         raise ValueError(
             f"Unsupported type of RANGE value {value}, must be " "string or dict"
@@ -676,6 +731,13 @@ _SCALAR_VALUE_TO_JSON_ROW = {
 }
 
 
+# Converters for the bounds of RANGE values, keyed by the supported element
+# types.
+_RANGE_ELEMENT_TO_JSON = {
+    element_type: _SCALAR_VALUE_TO_JSON_ROW[element_type]
+    for element_type in _SUPPORTED_RANGE_ELEMENTS
+}
+
 # Converters used for scalar values marshalled as query parameters.
 _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM["TIMESTAMP"] = _timestamp_to_json_parameter
@@ -690,25 +752,42 @@ def _warn_unknown_field_type(field):
     )
 
 
-def _scalar_field_to_json(field, row_value):
-    """Maps a field and value to a JSON-safe value.
+def _scalar_field_converter(field):
+    """Look up the converter to JSON-safe values for a scalar field.
 
     Args:
         field (google.cloud.bigquery.schema.SchemaField):
             The SchemaField to use for type conversion and field name.
-        row_value (Any):
-            Value to be converted, based on the field's type.
 
     Returns:
-        Any: A JSON-serializable object.
+        Callable[[Any], Any]:
+            A function converting a single value of the field's type. For
+            unknown types, it warns and returns the value unchanged.
     """
+    converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+    if converter is not None:
+        return converter
 
     def default_converter(value):
         _warn_unknown_field_type(field)
         return value
 
-    converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type, default_converter)
-    return converter(row_value)
+    return default_converter
+
+
+def _scalar_field_to_json(field, row_value):
+    """Maps a field and value to a JSON-safe value.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField):
+            The SchemaField to use for type conversion and field name.
+        row_value (Any):
+            Value to be converted, based on the field's type.
+
+    Returns:
+        Any: A JSON-serializable object.
+    """
+    return _scalar_field_converter(field)(row_value)
 
 
 def _repeated_field_to_json(field, row_value):
@@ -724,10 +803,30 @@ def _repeated_field_to_json(field, row_value):
     Returns:
         List[Any]: A list of JSON-serializable objects.
     """
-    values = []
-    for item in row_value:
-        values.append(_single_field_to_json(field, item))
-    return values
+    # Resolve the element conversion once, rather than dispatching on the
+    # field type again for every item.
+    field_type = field.field_type
+    if field_type == "RECORD":
+        subfields = field.fields
+        return [
+            None if item is None else _record_field_to_json(subfields, item)
+            for item in row_value
+        ]
+    if field_type == "RANGE":
+        element_type = field.range_element_type
+        return [
+            None if item is None else _range_field_to_json(element_type, item)
+            for item in row_value
+        ]
+
+    converter = _SCALAR_VALUE_TO_JSON_ROW.get(field_type)
+    if converter is not None:
+        # The known scalar converters all pass None through unchanged, so the
+        # items can be mapped directly.
+        return list(map(converter, row_value))
+
+    converter = _scalar_field_converter(field)
+    return [None if item is None else converter(item) for item in row_value]
 
 
 def _record_field_to_json(fields, row_value):
@@ -757,30 +856,35 @@ def _record_field_to_json(fields, row_value):
 
     record = {}
 
-    if isdict:
-        processed_fields = set()
+    if not isdict:
+        # The lengths were checked above, so zip() pairs every value.
+        for subfield, subvalue in zip(fields, row_value):
+            # None values are unconditionally omitted
+            if subvalue is not None:
+                record[subfield.name] = _field_to_json(subfield, subvalue)
+        return record
 
-    for subindex, subfield in enumerate(fields):
+    processed_fields = set()
+
+    for subfield in fields:
         subname = subfield.name
-        subvalue = row_value.get(subname) if isdict else row_value[subindex]
+        subvalue = row_value.get(subname)
 
         # None values are unconditionally omitted
         if subvalue is not None:
             record[subname] = _field_to_json(subfield, subvalue)
 
-        if isdict:
-            processed_fields.add(subname)
+        processed_fields.add(subname)
 
     # Unknown fields should not be silently dropped, include them. Since there
     # is no schema information available for them, include them as strings
     # to make them JSON-serializable.
-    if isdict:
-        not_processed = set(row_value.keys()) - processed_fields
+    not_processed = set(row_value.keys()) - processed_fields
 
-        for field_name in not_processed:
-            value = row_value[field_name]
-            if value is not None:
-                record[field_name] = str(value)
+    for field_name in not_processed:
+        value = row_value[field_name]
+        if value is not None:
+            record[field_name] = str(value)
 
     return record
 
@@ -840,6 +944,8 @@ def _field_to_json(field, row_value):
 
 def _snake_to_camel_case(value):
     """Convert snake case string to camel case."""
+    if "_" not in value:
+        return value
     words = value.split("_")
     return words[0] + "".join(map(str.capitalize, words[1:]))
 
@@ -883,7 +989,7 @@ def _get_sub_prop(container, keys, default=None):
         object: The value if present or the default.
     """
     if isinstance(keys, str):
-        keys = [keys]
+        keys = (keys,)
 
     sub_val = container
     for key in keys:
@@ -930,13 +1036,11 @@ def _set_sub_prop(container, keys, value):
         {'key': {'subkey': 'new'}}
     """
     if isinstance(keys, str):
-        keys = [keys]
+        keys = (keys,)
 
     sub_val = container
     for key in keys[:-1]:
-        if key not in sub_val:
-            sub_val[key] = {}
-        sub_val = sub_val[key]
+        sub_val = sub_val.setdefault(key, {})
     sub_val[keys[-1]] = value
 
 
@@ -947,8 +1051,9 @@ def _del_sub_prop(container, keys):
         container (Dict):
             A dictionary which may contain other dictionaries as values.
         keys (Iterable):
-            A sequence of keys to attempt to clear the value for. Each item in
-            the sequence represents a deeper nesting. The first key is for
+            A sequence of keys to attempt to clear the value for. If ``keys`` is
+            a string, it is treated as sequence containing a single string key.
+            Each item in the sequence represents a deeper nesting. The first key is for
             the top level. If there is a dictionary there, the second key
             attempts to get the value within that, and so on.
 
@@ -967,27 +1072,32 @@ def _del_sub_prop(container, keys):
         >>> container
         {'key': {}}
     """
+    if isinstance(keys, str):
+        keys = (keys,)
+
     sub_val = container
     for key in keys[:-1]:
-        if key not in sub_val:
-            sub_val[key] = {}
-        sub_val = sub_val[key]
+        sub_val = sub_val.setdefault(key, {})
     if keys[-1] in sub_val:
         del sub_val[keys[-1]]
 
 
 def _int_or_none(value):
     """Helper: deserialize int value from JSON string."""
+    if value is None:
+        return None
     if isinstance(value, int):
         return value
-    if value is not None:
-        return int(value)
+    return int(value)
 
 
 def _str_or_none(value):
     """Helper: serialize value to JSON string."""
-    if value is not None:
-        return str(value)
+    if value is None:
+        return None
+    if type(value) is str:
+        return value
+    return str(value)
 
 
 def _split_id(full_id):
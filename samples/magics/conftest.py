@@ -12,35 +12,55 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import typing
-from typing import Iterator
 
 import pytest
 
 if typing.TYPE_CHECKING:
-    from IPython.terminal.interactiveshell import TerminalInteractiveShell
+    from IPython.core.interactiveshell import InteractiveShell
 
-interactiveshell = pytest.importorskip("IPython.terminal.interactiveshell")
+
+interactiveshell = pytest.importorskip("IPython.core.interactiveshell")
 tools = pytest.importorskip("IPython.testing.tools")
 
 
+@functools.lru_cache(maxsize=1)
+def _default_config() -> typing.Any:
+    """Build the shell config once; it is the same for every session."""
+    return tools.default_config()
+
+
 @pytest.fixture(scope="session")
-def ipython() -> "TerminalInteractiveShell":
-    config = tools.default_config()
-    config.TerminalInteractiveShell.simple_prompt = True
-    shell = interactiveshell.TerminalInteractiveShell.instance(config=config)
+def ipython() -> "InteractiveShell":
+    shell_cls = interactiveshell.InteractiveShell
+    if shell_cls.initialized():
+        # Reuse the resident shell rather than rebuilding its config.
+        return shell_cls.instance()
+
+    shell = shell_cls.instance(config=_default_config())
     return shell
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module")
 def ipython_interactive(
-    ipython: "TerminalInteractiveShell",
-) -> Iterator["TerminalInteractiveShell"]:
+    request: pytest.FixtureRequest,
+    ipython: "InteractiveShell",
+) -> "InteractiveShell":
     """Activate IPython's builtin hooks
 
-    for the duration of the test scope.
+    for the duration of the test module.
+
+    This is not autouse: modules that run ``%%bigquery`` cells opt in with
+    ``pytest.mark.usefixtures("ipython_interactive")``, so other tests never
+    enter the builtin trap.
     """
 
-    trap = typing.cast(typing.ContextManager, ipython.builtin_trap)
-    with trap:
-        yield ipython
+    trap = ipython.builtin_trap
+    if getattr(trap, "_nested_level", 0) > 0:
+        # Already active (e.g. running under an outer IPython session).
+        return ipython
+
+    trap.__enter__()
+    request.addfinalizer(lambda: trap.__exit__(None, None, None))
+    return ipython
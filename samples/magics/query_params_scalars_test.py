@@ -13,10 +13,14 @@
 # limitations under the License.
 
 import pandas
+import pytest
 
 from . import query_params_scalars
 
 
+pytestmark = pytest.mark.usefixtures("ipython_interactive")
+
+
 def test_query_with_parameters() -> None:
     df = query_params_scalars.query_with_parameters()
     assert isinstance(df, pandas.DataFrame)
@@ -13,10 +13,14 @@
 # limitations under the License.
 
 import pandas
+import pytest
 
 from . import query
 
 
+pytestmark = pytest.mark.usefixtures("ipython_interactive")
+
+
 def test_query() -> None:
     df = query.query()
     assert isinstance(df, pandas.DataFrame)
@@ -14,24 +14,18 @@
 
 """System tests for pandas connector."""
 
-import collections
 import datetime
 import decimal
 import json
 import io
-import operator
 import warnings
 
 import google.api_core.retry
 import pytest
 
-try:
-    import importlib.metadata as metadata
-except ImportError:
-    import importlib_metadata as metadata
-
 from google.cloud import bigquery
 
+from google.cloud.bigquery import _versions_helpers
 from google.cloud.bigquery import enums
 
 from . import helpers
@@ -39,29 +33,110 @@ from . import helpers
 
 pandas = pytest.importorskip("pandas", minversion="0.23.0")
 pyarrow = pytest.importorskip("pyarrow")
+pyarrow_compute = pytest.importorskip("pyarrow.compute")
 numpy = pytest.importorskip("numpy")
 
 bigquery_storage = pytest.importorskip(
     "google.cloud.bigquery_storage", minversion="2.0.0"
 )
 
-if pandas is not None:
-    PANDAS_INSTALLED_VERSION = metadata.version("pandas")
-else:
-    PANDAS_INSTALLED_VERSION = "0.0.0"
+# Parsed once from pandas.__version__, rather than scanning the installed
+# distributions' metadata.
+PANDAS_INSTALLED_VERSION = _versions_helpers.PANDAS_VERSIONS.installed_version
+
+_UTC = datetime.timezone.utc
+_NUMERIC_MAX = decimal.Decimal("99999999999999999999999999999.999999999")
+_NUMERIC_MIN = decimal.Decimal("-99999999999999999999999999999.999999999")
+_BIGNUMERIC_MAX = decimal.Decimal("{d38}.{d38}".format(d38="9" * 38))
+_BIGNUMERIC_MIN = decimal.Decimal("-{d38}.{d38}".format(d38="9" * 38))
+
+# Schema detected for the DataFrame in automatic_schema_dataframe.
+_AUTOMATIC_SCHEMA = [
+    bigquery.SchemaField("bool_col", "BOOLEAN"),
+    bigquery.SchemaField("ts_col", "TIMESTAMP"),
+    bigquery.SchemaField("dt_col_no_tz", "DATETIME"),
+    bigquery.SchemaField("float32_col", "FLOAT"),
+    bigquery.SchemaField("float64_col", "FLOAT"),
+    bigquery.SchemaField("int8_col", "INTEGER"),
+    bigquery.SchemaField("int16_col", "INTEGER"),
+    bigquery.SchemaField("int32_col", "INTEGER"),
+    bigquery.SchemaField("int64_col", "INTEGER"),
+    bigquery.SchemaField("uint8_col", "INTEGER"),
+    bigquery.SchemaField("uint16_col", "INTEGER"),
+    bigquery.SchemaField("uint32_col", "INTEGER"),
+    bigquery.SchemaField("date_col", "DATE"),
+    bigquery.SchemaField("time_col", "TIME"),
+    bigquery.SchemaField("array_bool_col", "BOOLEAN", mode="REPEATED"),
+    bigquery.SchemaField("array_ts_col", "TIMESTAMP", mode="REPEATED"),
+    bigquery.SchemaField("array_dt_col_no_tz", "DATETIME", mode="REPEATED"),
+    bigquery.SchemaField("array_float32_col", "FLOAT", mode="REPEATED"),
+    bigquery.SchemaField("array_float64_col", "FLOAT", mode="REPEATED"),
+    bigquery.SchemaField("array_int8_col", "INTEGER", mode="REPEATED"),
+    bigquery.SchemaField("array_int16_col", "INTEGER", mode="REPEATED"),
+    bigquery.SchemaField("array_int32_col", "INTEGER", mode="REPEATED"),
+    bigquery.SchemaField("array_int64_col", "INTEGER", mode="REPEATED"),
+    bigquery.SchemaField("array_uint8_col", "INTEGER", mode="REPEATED"),
+    bigquery.SchemaField("array_uint16_col", "INTEGER", mode="REPEATED"),
+    bigquery.SchemaField("array_uint32_col", "INTEGER", mode="REPEATED"),
+]
+
+
+# Scalar columns of scalars_table / scalars_extreme_table.
+# TODO(GH#836): Avoid INTERVAL columns until they are supported by the
+# BigQuery Storage API and pyarrow.
+_SCALARS_SCHEMA = [
+    bigquery.SchemaField("bool_col", enums.SqlTypeNames.BOOLEAN),
+    bigquery.SchemaField("bignumeric_col", enums.SqlTypeNames.BIGNUMERIC),
+    bigquery.SchemaField("bytes_col", enums.SqlTypeNames.BYTES),
+    bigquery.SchemaField("date_col", enums.SqlTypeNames.DATE),
+    bigquery.SchemaField("datetime_col", enums.SqlTypeNames.DATETIME),
+    bigquery.SchemaField("float64_col", enums.SqlTypeNames.FLOAT64),
+    bigquery.SchemaField("geography_col", enums.SqlTypeNames.GEOGRAPHY),
+    bigquery.SchemaField("int64_col", enums.SqlTypeNames.INT64),
+    bigquery.SchemaField("numeric_col", enums.SqlTypeNames.NUMERIC),
+    bigquery.SchemaField("string_col", enums.SqlTypeNames.STRING),
+    bigquery.SchemaField("time_col", enums.SqlTypeNames.TIME),
+    bigquery.SchemaField("timestamp_col", enums.SqlTypeNames.TIMESTAMP),
+]
+
+
+def _single_element_arrays(values, dtype):
+    """Build a Series of one-element numpy arrays, one per value.
+
+    The arrays are views into a single contiguous buffer rather than
+    separate allocations.
+    """
+    values = numpy.asarray(values, dtype=dtype)
+    offsets = numpy.arange(len(values) + 1, dtype=numpy.int32)
+    return pandas.Series(pyarrow.ListArray.from_arrays(offsets, values).to_pandas())
+
+
+@pytest.fixture(scope="session")
+def table_id_prefix(bigquery_client, dataset_id):
+    return f"{bigquery_client.project}.{dataset_id}"
 
 
 class MissingDataError(Exception):
     pass
 
 
-def test_load_table_from_dataframe_w_automatic_schema(bigquery_client, dataset_id):
-    """Test that a DataFrame with dtypes that map well to BigQuery types
-    can be uploaded without specifying a schema.
+# Use query to fetch rows instead of listing directly from the table so
+# that we get values from the streaming buffer "within a few seconds".
+# https://cloud.google.com/bigquery/streaming-data-into-bigquery#dataavailability
+@google.api_core.retry.Retry(
+    predicate=google.api_core.retry.if_exception_type(MissingDataError),
+    deadline=120.0,
+)
+def _query_streamed_rows(bigquery_client, sql, expected_count):
+    rows = list(bigquery_client.query_and_wait(sql))
+    if len(rows) != expected_count:
+        raise MissingDataError()
+    return rows
 
-    https://github.com/googleapis/google-cloud-python/issues/9044
-    """
-    df_data = collections.OrderedDict(
+
+@pytest.fixture(scope="module")
+def automatic_schema_dataframe():
+    df_data = dict(
         [
             ("bool_col", pandas.Series([True, False, True], dtype="bool")),
             (
@@ -73,7 +148,7 @@ def test_load_table_from_dataframe_w_automatic_schema(bigquery_client, dataset_i
                         datetime.datetime(2012, 3, 14, 15, 16),
                     ],
                     dtype="datetime64[ns]",
-                ).dt.tz_localize(datetime.timezone.utc),
+                ).dt.tz_localize(_UTC),
             ),
             (
                 "dt_col_no_tz",
@@ -123,19 +198,13 @@ def test_load_table_from_dataframe_w_automatic_schema(bigquery_client, dataset_i
                 pandas.Series(
                     [
                         [
-                            datetime.datetime(
-                                2010, 1, 2, 3, 44, 50, tzinfo=datetime.timezone.utc
-                            ),
+                            datetime.datetime(2010, 1, 2, 3, 44, 50, tzinfo=_UTC),
                         ],
                         [
-                            datetime.datetime(
-                                2011, 2, 3, 14, 50, 59, tzinfo=datetime.timezone.utc
-                            ),
+                            datetime.datetime(2011, 2, 3, 14, 50, 59, tzinfo=_UTC),
                         ],
                         [
-                            datetime.datetime(
-                                2012, 3, 14, 15, 16, tzinfo=datetime.timezone.utc
-                            ),
+                            datetime.datetime(2012, 3, 14, 15, 16, tzinfo=_UTC),
                         ],
                     ],
                 ),
@@ -152,98 +221,79 @@ def test_load_table_from_dataframe_w_automatic_schema(bigquery_client, dataset_i
             ),
             (
                 "array_float32_col",
-                pandas.Series(
-                    [numpy.array([_], dtype="float32") for _ in [1.0, 2.0, 3.0]]
-                ),
+                _single_element_arrays([1.0, 2.0, 3.0], dtype="float32"),
             ),
             (
                 "array_float64_col",
-                pandas.Series(
-                    [numpy.array([_], dtype="float64") for _ in [4.0, 5.0, 6.0]]
-                ),
+                _single_element_arrays([4.0, 5.0, 6.0], dtype="float64"),
             ),
             (
                 "array_int8_col",
-                pandas.Series(
-                    [numpy.array([_], dtype="int8") for _ in [-12, -11, -10]]
-                ),
+                _single_element_arrays([-12, -11, -10], dtype="int8"),
             ),
             (
                 "array_int16_col",
-                pandas.Series([numpy.array([_], dtype="int16") for _ in [-9, -8, -7]]),
+                _single_element_arrays([-9, -8, -7], dtype="int16"),
             ),
             (
                 "array_int32_col",
-                pandas.Series([numpy.array([_], dtype="int32") for _ in [-6, -5, -4]]),
+                _single_element_arrays([-6, -5, -4], dtype="int32"),
             ),
             (
                 "array_int64_col",
-                pandas.Series([numpy.array([_], dtype="int64") for _ in [-3, -2, -1]]),
+                _single_element_arrays([-3, -2, -1], dtype="int64"),
             ),
             (
                 "array_uint8_col",
-                pandas.Series([numpy.array([_], dtype="uint8") for _ in [0, 1, 2]]),
+                _single_element_arrays([0, 1, 2], dtype="uint8"),
             ),
             (
                 "array_uint16_col",
-                pandas.Series([numpy.array([_], dtype="uint16") for _ in [3, 4, 5]]),
+                _single_element_arrays([3, 4, 5], dtype="uint16"),
             ),
             (
                 "array_uint32_col",
-                pandas.Series([numpy.array([_], dtype="uint32") for _ in [6, 7, 8]]),
+                _single_element_arrays([6, 7, 8], dtype="uint32"),
             ),
         ]
     )
-    dataframe = pandas.DataFrame(df_data, columns=df_data.keys())
+    return pandas.DataFrame(df_data, columns=df_data.keys())
 
-    table_id = "{}.{}.load_table_from_dataframe_w_automatic_schema".format(
-        bigquery_client.project, dataset_id
-    )
 
-    load_job = bigquery_client.load_table_from_dataframe(dataframe, table_id)
+def test_load_table_from_dataframe_w_automatic_schema(
+    bigquery_client, bqstorage_client, table_id_prefix, automatic_schema_dataframe
+):
+    """Test that a DataFrame with dtypes that map well to BigQuery types
+    can be uploaded without specifying a schema.
+
+    https://github.com/googleapis/google-cloud-python/issues/9044
+    """
+    table_id = f"{table_id_prefix}.load_table_from_dataframe_w_automatic_schema"
+
+    load_job = bigquery_client.load_table_from_dataframe(
+        automatic_schema_dataframe, table_id
+    )
     load_job.result()
 
     table = bigquery_client.get_table(table_id)
-    assert tuple(table.schema) == (
-        bigquery.SchemaField("bool_col", "BOOLEAN"),
-        bigquery.SchemaField("ts_col", "TIMESTAMP"),
-        bigquery.SchemaField("dt_col_no_tz", "DATETIME"),
-        bigquery.SchemaField("float32_col", "FLOAT"),
-        bigquery.SchemaField("float64_col", "FLOAT"),
-        bigquery.SchemaField("int8_col", "INTEGER"),
-        bigquery.SchemaField("int16_col", "INTEGER"),
-        bigquery.SchemaField("int32_col", "INTEGER"),
-        bigquery.SchemaField("int64_col", "INTEGER"),
-        bigquery.SchemaField("uint8_col", "INTEGER"),
-        bigquery.SchemaField("uint16_col", "INTEGER"),
-        bigquery.SchemaField("uint32_col", "INTEGER"),
-        bigquery.SchemaField("date_col", "DATE"),
-        bigquery.SchemaField("time_col", "TIME"),
-        bigquery.SchemaField("array_bool_col", "BOOLEAN", mode="REPEATED"),
-        bigquery.SchemaField("array_ts_col", "TIMESTAMP", mode="REPEATED"),
-        bigquery.SchemaField("array_dt_col_no_tz", "DATETIME", mode="REPEATED"),
-        bigquery.SchemaField("array_float32_col", "FLOAT", mode="REPEATED"),
-        bigquery.SchemaField("array_float64_col", "FLOAT", mode="REPEATED"),
-        bigquery.SchemaField("array_int8_col", "INTEGER", mode="REPEATED"),
-        bigquery.SchemaField("array_int16_col", "INTEGER", mode="REPEATED"),
-        bigquery.SchemaField("array_int32_col", "INTEGER", mode="REPEATED"),
-        bigquery.SchemaField("array_int64_col", "INTEGER", mode="REPEATED"),
-        bigquery.SchemaField("array_uint8_col", "INTEGER", mode="REPEATED"),
-        bigquery.SchemaField("array_uint16_col", "INTEGER", mode="REPEATED"),
-        bigquery.SchemaField("array_uint32_col", "INTEGER", mode="REPEATED"),
-    )
+    assert table.schema == _AUTOMATIC_SCHEMA
 
-    assert numpy.array(
-        sorted(map(list, bigquery_client.list_rows(table)), key=lambda r: r[5]),
-        dtype="object",
-    ).transpose().tolist() == [
+    # Read back in columnar form and sort by int8_col, so each column can be
+    # compared without materializing Row objects.
+    arrow_table = bigquery_client.list_rows(table).to_arrow(
+        bqstorage_client=bqstorage_client
+    )
+    arrow_table = arrow_table.take(
+        pyarrow_compute.sort_indices(arrow_table, sort_keys=[("int8_col", "ascending")])
+    )
+    assert [column.to_pylist() for column in arrow_table.columns] == [
         # bool_col
         [True, False, True],
         # ts_col
         [
-            datetime.datetime(2010, 1, 2, 3, 44, 50, tzinfo=datetime.timezone.utc),
-            datetime.datetime(2011, 2, 3, 14, 50, 59, tzinfo=datetime.timezone.utc),
-            datetime.datetime(2012, 3, 14, 15, 16, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2010, 1, 2, 3, 44, 50, tzinfo=_UTC),
+            datetime.datetime(2011, 2, 3, 14, 50, 59, tzinfo=_UTC),
+            datetime.datetime(2012, 3, 14, 15, 16, tzinfo=_UTC),
         ],
         # dt_col_no_tz
         [
@@ -281,9 +331,9 @@ def test_load_table_from_dataframe_w_automatic_schema(bigquery_client, dataset_i
         [[True], [False], [True]],
         # array_ts_col
         [
-            [datetime.datetime(2010, 1, 2, 3, 44, 50, tzinfo=datetime.timezone.utc)],
-            [datetime.datetime(2011, 2, 3, 14, 50, 59, tzinfo=datetime.timezone.utc)],
-            [datetime.datetime(2012, 3, 14, 15, 16, tzinfo=datetime.timezone.utc)],
+            [datetime.datetime(2010, 1, 2, 3, 44, 50, tzinfo=_UTC)],
+            [datetime.datetime(2011, 2, 3, 14, 50, 59, tzinfo=_UTC)],
+            [datetime.datetime(2012, 3, 14, 15, 16, tzinfo=_UTC)],
         ],
         # array_dt_col
         [
@@ -312,66 +362,44 @@ def test_load_table_from_dataframe_w_automatic_schema(bigquery_client, dataset_i
     ]
 
 
-@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
-def test_load_table_from_dataframe_w_nullable_int64_datatype(
-    bigquery_client, dataset_id
-):
-    """Test that a DataFrame containing column with None-type values and int64 datatype
-    can be uploaded if a BigQuery schema is specified.
-
-    https://github.com/googleapis/python-bigquery/issues/22
-    """
-    table_id = "{}.{}.load_table_from_dataframe_w_nullable_int64_datatype".format(
-        bigquery_client.project, dataset_id
-    )
-    table_schema = (bigquery.SchemaField("x", "INTEGER", mode="NULLABLE"),)
-    table = helpers.retry_403(bigquery_client.create_table)(
-        bigquery.Table(table_id, schema=table_schema)
-    )
-
-    df_data = collections.OrderedDict(
-        [("x", pandas.Series([1, 2, None, 4], dtype="Int64"))]
-    )
-    dataframe = pandas.DataFrame(df_data, columns=df_data.keys())
-    load_job = bigquery_client.load_table_from_dataframe(dataframe, table_id)
-    load_job.result()
-    table = bigquery_client.get_table(table_id)
-    assert tuple(table.schema) == (bigquery.SchemaField("x", "INTEGER"),)
-    assert table.num_rows == 4
-
-
-@pytest.mark.skipif(
-    PANDAS_INSTALLED_VERSION[0:2].startswith("0."),
-    reason="Only `pandas version >=1.0.0` is supported",
+@pytest.mark.parametrize(
+    "create_table_first",
+    [True, False],
+    ids=["explicit_schema", "automatic_schema"],
 )
-def test_load_table_from_dataframe_w_nullable_int64_datatype_automatic_schema(
-    bigquery_client, dataset_id, table_id
+def test_load_table_from_dataframe_w_nullable_int64_datatype(
+    bigquery_client, table_id_prefix, test_table_name, create_table_first
 ):
     """Test that a DataFrame containing column with None-type values and int64 datatype
-    can be uploaded without specifying a schema.
+    can be uploaded, both into a table created with a BigQuery schema and
+    without specifying a schema.
 
     https://github.com/googleapis/python-bigquery/issues/22
     """
+    table_id = f"{table_id_prefix}.{test_table_name}"
+    if create_table_first:
+        table_schema = [bigquery.SchemaField("x", "INTEGER", mode="NULLABLE")]
+        helpers.retry_403(bigquery_client.create_table)(
+            bigquery.Table(table_id, schema=table_schema)
+        )
 
-    df_data = collections.OrderedDict(
-        [("x", pandas.Series([1, 2, None, 4], dtype="Int64"))]
-    )
+    df_data = {"x": pandas.Series([1, 2, None, 4], dtype="Int64")}
     dataframe = pandas.DataFrame(df_data, columns=df_data.keys())
     load_job = bigquery_client.load_table_from_dataframe(dataframe, table_id)
     load_job.result()
     table = bigquery_client.get_table(table_id)
-    assert tuple(table.schema) == (bigquery.SchemaField("x", "INTEGER"),)
+    assert table.schema == [bigquery.SchemaField("x", "INTEGER")]
     assert table.num_rows == 4
 
 
-def test_load_table_from_dataframe_w_nulls(bigquery_client, dataset_id):
+def test_load_table_from_dataframe_w_nulls(bigquery_client, table_id_prefix):
     """Test that a DataFrame with null columns can be uploaded if a
     BigQuery schema is specified.
 
     See: https://github.com/googleapis/google-cloud-python/issues/7370
     """
     # Schema with all scalar types.
-    table_schema = (
+    table_schema = [
         bigquery.SchemaField("bool_col", "BOOLEAN"),
         bigquery.SchemaField("bytes_col", "BYTES"),
         bigquery.SchemaField("date_col", "DATE"),
@@ -384,7 +412,7 @@ def test_load_table_from_dataframe_w_nulls(bigquery_client, dataset_id):
         bigquery.SchemaField("time_col", "TIME"),
         bigquery.SchemaField("ts_col", "TIMESTAMP"),
         bigquery.SchemaField("bignum_col", "BIGNUMERIC"),
-    )
+    ]
 
     num_rows = 100
     nulls = [None] * num_rows
@@ -402,12 +430,10 @@ def test_load_table_from_dataframe_w_nulls(bigquery_client, dataset_id):
         ("ts_col", nulls),
         ("bignum_col", nulls),
     ]
-    df_data = collections.OrderedDict(df_data)
+    df_data = dict(df_data)
     dataframe = pandas.DataFrame(df_data, columns=df_data.keys())
 
-    table_id = "{}.{}.load_table_from_dataframe_w_nulls".format(
-        bigquery_client.project, dataset_id
-    )
+    table_id = f"{table_id_prefix}.load_table_from_dataframe_w_nulls"
 
     # Create the table before loading so that schema mismatch errors are
     # identified.
@@ -422,25 +448,23 @@ def test_load_table_from_dataframe_w_nulls(bigquery_client, dataset_id):
     load_job.result()
 
     table = bigquery_client.get_table(table)
-    assert tuple(table.schema) == table_schema
+    assert table.schema == table_schema
     assert table.num_rows == num_rows
 
 
-def test_load_table_from_dataframe_w_required(bigquery_client, dataset_id):
+def test_load_table_from_dataframe_w_required(bigquery_client, table_id_prefix):
     """Test that a DataFrame can be uploaded to a table with required columns.
 
     See: https://github.com/googleapis/google-cloud-python/issues/8093
     """
-    table_schema = (
+    table_schema = [
         bigquery.SchemaField("name", "STRING", mode="REQUIRED"),
         bigquery.SchemaField("age", "INTEGER", mode="REQUIRED"),
-    )
+    ]
 
     records = [{"name": "Chip", "age": 2}, {"name": "Dale", "age": 3}]
     dataframe = pandas.DataFrame(records, columns=["name", "age"])
-    table_id = "{}.{}.load_table_from_dataframe_w_required".format(
-        bigquery_client.project, dataset_id
-    )
+    table_id = f"{table_id_prefix}.load_table_from_dataframe_w_required"
 
     # Create the table before loading so that schema mismatch errors are
     # identified.
@@ -452,24 +476,24 @@ def test_load_table_from_dataframe_w_required(bigquery_client, dataset_id):
     load_job.result()
 
     table = bigquery_client.get_table(table)
-    assert tuple(table.schema) == table_schema
+    assert table.schema == table_schema
     assert table.num_rows == 2
     for field in table.schema:
         assert field.mode == "REQUIRED"
 
 
 def test_load_table_from_dataframe_w_required_but_local_nulls_fails(
-    bigquery_client, dataset_id
+    bigquery_client, table_id_prefix
 ):
     """Test that a DataFrame with nulls can't be uploaded to a table with
     required columns.
 
     See: https://github.com/googleapis/python-bigquery/issues/1692
     """
-    table_schema = (
+    table_schema = [
         bigquery.SchemaField("name", "STRING", mode="REQUIRED"),
         bigquery.SchemaField("age", "INTEGER", mode="REQUIRED"),
-    )
+    ]
 
     records = [
         {"name": "Chip", "age": 2},
@@ -479,9 +503,7 @@ def test_load_table_from_dataframe_w_required_but_local_nulls_fails(
     ]
     dataframe = pandas.DataFrame(records, columns=["name", "age"])
     table_id = (
-        "{}.{}.load_table_from_dataframe_w_required_but_local_nulls_fails".format(
-            bigquery_client.project, dataset_id
-        )
+        f"{table_id_prefix}.load_table_from_dataframe_w_required_but_local_nulls_fails"
     )
 
     # Create the table before loading so that schema mismatch errors are
@@ -494,27 +516,8 @@ def test_load_table_from_dataframe_w_required_but_local_nulls_fails(
         bigquery_client.load_table_from_dataframe(dataframe, table_id).result()
 
 
-def test_load_table_from_dataframe_w_explicit_schema(bigquery_client, dataset_id):
-    # Schema with all scalar types.
-    # See:
-    #       https://github.com/googleapis/python-bigquery/issues/61
-    #       https://issuetracker.google.com/issues/151765076
-    table_schema = (
-        bigquery.SchemaField("row_num", "INTEGER"),
-        bigquery.SchemaField("bool_col", "BOOLEAN"),
-        bigquery.SchemaField("bytes_col", "BYTES"),
-        bigquery.SchemaField("date_col", "DATE"),
-        bigquery.SchemaField("dt_col", "DATETIME"),
-        bigquery.SchemaField("float_col", "FLOAT"),
-        bigquery.SchemaField("geo_col", "GEOGRAPHY"),
-        bigquery.SchemaField("int_col", "INTEGER"),
-        bigquery.SchemaField("num_col", "NUMERIC"),
-        bigquery.SchemaField("str_col", "STRING"),
-        bigquery.SchemaField("time_col", "TIME"),
-        bigquery.SchemaField("ts_col", "TIMESTAMP"),
-        bigquery.SchemaField("bignum_col", "BIGNUMERIC"),
-    )
-
+@pytest.fixture(scope="module")
+def explicit_schema_dataframe():
     df_data = [
         ("row_num", [1, 2, 3]),
         ("bool_col", [True, None, False]),
@@ -537,9 +540,9 @@ def test_load_table_from_dataframe_w_explicit_schema(bigquery_client, dataset_id
         (
             "num_col",
             [
-                decimal.Decimal("-99999999999999999999999999999.999999999"),
+                _NUMERIC_MIN,
                 None,
-                decimal.Decimal("99999999999999999999999999999.999999999"),
+                _NUMERIC_MAX,
             ],
         ),
         ("str_col", ["abc", None, "def"]),
@@ -550,40 +553,62 @@ def test_load_table_from_dataframe_w_explicit_schema(bigquery_client, dataset_id
         (
             "ts_col",
             [
-                datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=_UTC),
                 None,
-                datetime.datetime(
-                    9999, 12, 31, 23, 59, 59, 999999, tzinfo=datetime.timezone.utc
-                ),
+                datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=_UTC),
             ],
         ),
         (
             "bignum_col",
             [
-                decimal.Decimal("-{d38}.{d38}".format(d38="9" * 38)),
+                _BIGNUMERIC_MIN,
                 None,
-                decimal.Decimal("{d38}.{d38}".format(d38="9" * 38)),
+                _BIGNUMERIC_MAX,
             ],
         ),
     ]
-    df_data = collections.OrderedDict(df_data)
-    dataframe = pandas.DataFrame(df_data, dtype="object", columns=df_data.keys())
+    df_data = dict(df_data)
+    return pandas.DataFrame(df_data, dtype="object", columns=df_data.keys())
 
-    table_id = "{}.{}.load_table_from_dataframe_w_explicit_schema".format(
-        bigquery_client.project, dataset_id
-    )
+
+def test_load_table_from_dataframe_w_explicit_schema(
+    bigquery_client, bqstorage_client, table_id_prefix, explicit_schema_dataframe
+):
+    # Schema with all scalar types.
+    # See:
+    #       https://github.com/googleapis/python-bigquery/issues/61
+    #       https://issuetracker.google.com/issues/151765076
+    table_schema = [
+        bigquery.SchemaField("row_num", "INTEGER"),
+        bigquery.SchemaField("bool_col", "BOOLEAN"),
+        bigquery.SchemaField("bytes_col", "BYTES"),
+        bigquery.SchemaField("date_col", "DATE"),
+        bigquery.SchemaField("dt_col", "DATETIME"),
+        bigquery.SchemaField("float_col", "FLOAT"),
+        bigquery.SchemaField("geo_col", "GEOGRAPHY"),
+        bigquery.SchemaField("int_col", "INTEGER"),
+        bigquery.SchemaField("num_col", "NUMERIC"),
+        bigquery.SchemaField("str_col", "STRING"),
+        bigquery.SchemaField("time_col", "TIME"),
+        bigquery.SchemaField("ts_col", "TIMESTAMP"),
+        bigquery.SchemaField("bignum_col", "BIGNUMERIC"),
+    ]
+
+    table_id = f"{table_id_prefix}.load_table_from_dataframe_w_explicit_schema"
 
     job_config = bigquery.LoadJobConfig(schema=table_schema)
     load_job = bigquery_client.load_table_from_dataframe(
-        dataframe, table_id, job_config=job_config
+        explicit_schema_dataframe, table_id, job_config=job_config
     )
     load_job.result()
 
     table = bigquery_client.get_table(table_id)
-    assert tuple(table.schema) == table_schema
+    assert table.schema == table_schema
     assert table.num_rows == 3
 
-    result = bigquery_client.list_rows(table).to_dataframe()
+    result = bigquery_client.list_rows(table).to_dataframe(
+        bqstorage_client=bqstorage_client
+    )
     result.sort_values("row_num", inplace=True)
 
     # Check that extreme DATE/DATETIME values are loaded correctly.
@@ -592,23 +617,19 @@ def test_load_table_from_dataframe_w_explicit_schema(bigquery_client, dataset_id
     assert result["date_col"][2] == datetime.date(9999, 12, 31)
     assert result["dt_col"][0] == datetime.datetime(1, 1, 1, 0, 0, 0)
     assert result["dt_col"][2] == datetime.datetime(9999, 12, 31, 23, 59, 59, 999999)
-    assert result["ts_col"][0] == datetime.datetime(
-        1, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc
-    )
+    assert result["ts_col"][0] == datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=_UTC)
     assert result["ts_col"][2] == datetime.datetime(
-        9999, 12, 31, 23, 59, 59, 999999, tzinfo=datetime.timezone.utc
+        9999, 12, 31, 23, 59, 59, 999999, tzinfo=_UTC
     )
 
 
-def test_load_table_from_dataframe_w_struct_datatype(bigquery_client, dataset_id):
+def test_load_table_from_dataframe_w_struct_datatype(bigquery_client, table_id_prefix):
     """Test that a DataFrame with struct datatype can be uploaded if a
     BigQuery schema is specified.
 
     https://github.com/googleapis/python-bigquery/issues/21
     """
-    table_id = "{}.{}.load_table_from_dataframe_w_struct_datatype".format(
-        bigquery_client.project, dataset_id
-    )
+    table_id = f"{table_id_prefix}.load_table_from_dataframe_w_struct_datatype"
     table_schema = [
         bigquery.SchemaField(
             "bar",
@@ -636,11 +657,11 @@ def test_load_table_from_dataframe_w_struct_datatype(bigquery_client, dataset_id
 
 
 def test_load_table_from_dataframe_w_explicit_schema_source_format_csv(
-    bigquery_client, dataset_id
+    bigquery_client, table_id_prefix
 ):
     from google.cloud.bigquery.job import SourceFormat
 
-    table_schema = (
+    table_schema = [
         bigquery.SchemaField("bool_col", "BOOLEAN"),
         bigquery.SchemaField("bytes_col", "BYTES"),
         bigquery.SchemaField("date_col", "DATE"),
@@ -653,8 +674,8 @@ def test_load_table_from_dataframe_w_explicit_schema_source_format_csv(
         bigquery.SchemaField("str_col", "STRING"),
         bigquery.SchemaField("time_col", "TIME"),
         bigquery.SchemaField("ts_col", "TIMESTAMP"),
-    )
-    df_data = collections.OrderedDict(
+    ]
+    df_data = dict(
         [
             ("bool_col", [True, None, False]),
             ("bytes_col", ["abc", None, "def"]),
@@ -683,17 +704,17 @@ def test_load_table_from_dataframe_w_explicit_schema_source_format_csv(
             (
                 "num_col",
                 [
-                    decimal.Decimal("-99999999999999999999999999999.999999999"),
+                    _NUMERIC_MIN,
                     None,
-                    decimal.Decimal("99999999999999999999999999999.999999999"),
+                    _NUMERIC_MAX,
                 ],
             ),
             (
                 "bignum_col",
                 [
-                    decimal.Decimal("-{d38}.{d38}".format(d38="9" * 38)),
+                    _BIGNUMERIC_MIN,
                     None,
-                    decimal.Decimal("{d38}.{d38}".format(d38="9" * 38)),
+                    _BIGNUMERIC_MAX,
                 ],
             ),
             ("str_col", ["abc", None, "def"]),
@@ -704,20 +725,16 @@ def test_load_table_from_dataframe_w_explicit_schema_source_format_csv(
             (
                 "ts_col",
                 [
-                    datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc),
+                    datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=_UTC),
                     None,
-                    datetime.datetime(
-                        9999, 12, 31, 23, 59, 59, 999999, tzinfo=datetime.timezone.utc
-                    ),
+                    datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=_UTC),
                 ],
             ),
         ]
     )
     dataframe = pandas.DataFrame(df_data, dtype="object", columns=df_data.keys())
 
-    table_id = "{}.{}.load_table_from_dataframe_w_explicit_schema_csv".format(
-        bigquery_client.project, dataset_id
-    )
+    table_id = f"{table_id_prefix}.load_table_from_dataframe_w_explicit_schema_csv"
 
     job_config = bigquery.LoadJobConfig(
         schema=table_schema, source_format=SourceFormat.CSV
@@ -728,7 +745,7 @@ def test_load_table_from_dataframe_w_explicit_schema_source_format_csv(
     load_job.result()
 
     table = bigquery_client.get_table(table_id)
-    assert tuple(table.schema) == table_schema
+    assert table.schema == table_schema
     assert table.num_rows == 3
 
 
@@ -737,8 +754,8 @@ def test_load_table_from_dataframe_w_explicit_schema_source_format_csv_floats(
 ):
     from google.cloud.bigquery.job import SourceFormat
 
-    table_schema = (bigquery.SchemaField("float_col", "FLOAT"),)
-    df_data = collections.OrderedDict(
+    table_schema = [bigquery.SchemaField("float_col", "FLOAT")]
+    df_data = dict(
         [
             (
                 "float_col",
@@ -767,9 +784,13 @@ def test_load_table_from_dataframe_w_explicit_schema_source_format_csv_floats(
     load_job.result()
 
     table = bigquery_client.get_table(table_id)
-    rows = bigquery_client.list_rows(table_id)
-    floats = [r.values()[0] for r in rows]
-    assert tuple(table.schema) == table_schema
+    floats = (
+        bigquery_client.list_rows(table_id)
+        .to_arrow(create_bqstorage_client=False)
+        .column("float_col")
+        .to_pylist()
+    )
+    assert table.schema == table_schema
     assert table.num_rows == 9
     assert floats == df_data["float_col"]
 
@@ -793,24 +814,18 @@ def test_query_results_to_dataframe(bigquery_client):
         "timestamp": pandas.Timestamp,
         "dead": bool,
     }
-    for _, row in df.iterrows():
-        for col in column_names:
-            # all the schema fields are nullable, so None is acceptable
-            if not pandas.isna(row[col]):
-                assert isinstance(row[col], exp_datatypes[col])
+    for col, datatype in exp_datatypes.items():
+        # all the schema fields are nullable, so None is acceptable
+        assert df[col].dropna().map(type).eq(datatype).all()
 
 
-def test_query_results_to_dataframe_w_bqstorage(bigquery_client):
+def test_query_results_to_dataframe_w_bqstorage(bigquery_client, bqstorage_client):
     query = """
     SELECT id, `by`, timestamp, dead
     FROM `bigquery-public-data.hacker_news.full`
     LIMIT 10
     """
 
-    bqstorage_client = bigquery_storage.BigQueryReadClient(
-        credentials=bigquery_client._credentials
-    )
-
     df = bigquery_client.query(query).result().to_dataframe(bqstorage_client)
 
     assert isinstance(df, pandas.DataFrame)
@@ -823,11 +838,9 @@ def test_query_results_to_dataframe_w_bqstorage(bigquery_client):
         "timestamp": pandas.Timestamp,
         "dead": bool,
     }
-    for index, row in df.iterrows():
-        for col in column_names:
-            # all the schema fields are nullable, so None is acceptable
-            if not pandas.isna(row[col]):
-                assert isinstance(row[col], exp_datatypes[col])
+    for col, datatype in exp_datatypes.items():
+        # all the schema fields are nullable, so None is acceptable
+        assert df[col].dropna().map(type).eq(datatype).all()
 
 
 def test_insert_rows_from_dataframe(bigquery_client, dataset_id):
@@ -844,69 +857,36 @@ def test_insert_rows_from_dataframe(bigquery_client, dataset_id):
     ]
 
     dataframe = pandas.DataFrame(
-        [
-            {
-                "float_col": 1.11,
-                "bool_col": True,
-                "string_col": "my string",
-                "int_col": 10,
-                "date_col": datetime.date(2021, 1, 1),
-                "time_col": datetime.time(21, 1, 1),
-            },
-            {
-                "float_col": 2.22,
-                "bool_col": False,
-                "string_col": "another string",
-                "int_col": 20,
-                "date_col": datetime.date(2021, 1, 2),
-                "time_col": datetime.time(21, 1, 2),
-            },
-            {
-                "float_col": 3.33,
-                "bool_col": False,
-                "string_col": "another string",
-                "int_col": 30,
-                "date_col": datetime.date(2021, 1, 3),
-                "time_col": datetime.time(21, 1, 3),
-            },
-            {
-                "float_col": 4.44,
-                "bool_col": True,
-                "string_col": "another string",
-                "int_col": 40,
-                "date_col": datetime.date(2021, 1, 4),
-                "time_col": datetime.time(21, 1, 4),
-            },
-            {
-                "float_col": 5.55,
-                "bool_col": False,
-                "string_col": "another string",
-                "int_col": 50,
-                "date_col": datetime.date(2021, 1, 5),
-                "time_col": datetime.time(21, 1, 5),
-            },
-            {
-                "float_col": 6.66,
-                "bool_col": True,
+        {
+            "float_col": [1.11, 2.22, 3.33, 4.44, 5.55, 6.66],
+            "bool_col": [True, False, False, True, False, True],
+            "string_col": [
+                "my string",
+                "another string",
+                "another string",
+                "another string",
+                "another string",
                 # Include a NaN value, because pandas often uses NaN as a
                 # NULL value indicator.
-                "string_col": float("NaN"),
-                "int_col": 60,
-                "date_col": datetime.date(2021, 1, 6),
-                "time_col": datetime.time(21, 1, 6),
-            },
-        ]
-    )
-    dataframe["date_col"] = dataframe["date_col"].astype("dbdate")
-    dataframe["time_col"] = dataframe["time_col"].astype("dbtime")
-
-    # Support nullable integer and boolean dtypes.
-    # https://github.com/googleapis/python-bigquery/issues/1815
-    dataframe["int64_col"] = pandas.Series(
-        [-11, -22, pandas.NA, -44, -55, -66], dtype="Int64"
-    )
-    dataframe["boolean_col"] = pandas.Series(
-        [True, False, True, pandas.NA, True, False], dtype="boolean"
+                float("NaN"),
+            ],
+            "int_col": [10, 20, 30, 40, 50, 60],
+            "date_col": pandas.Series(
+                [datetime.date(2021, 1, day) for day in range(1, 7)], dtype="dbdate"
+            ),
+            "time_col": pandas.Series(
+                [datetime.time(21, 1, second) for second in range(1, 7)],
+                dtype="dbtime",
+            ),
+            # Support nullable integer and boolean dtypes.
+            # https://github.com/googleapis/python-bigquery/issues/1815
+            "int64_col": pandas.Series(
+                [-11, -22, pandas.NA, -44, -55, -66], dtype="Int64"
+            ),
+            "boolean_col": pandas.Series(
+                [True, False, True, pandas.NA, True, False], dtype="boolean"
+            ),
+        }
     )
 
     table_id = f"{bigquery_client.project}.{dataset_id}.test_insert_rows_from_dataframe"
@@ -918,95 +898,90 @@ def test_insert_rows_from_dataframe(bigquery_client, dataset_id):
     )
     for errors in chunk_errors:
         assert not errors
+    # Pandas often represents NULL values as NaN. Convert to None for
+    # easier comparison. Select the columns in schema order so that each
+    # expected row lines up with the values the query returns.
     expected = [
-        # Pandas often represents NULL values as NaN. Convert to None for
-        # easier comparison.
-        tuple(None if pandas.isna(col) else col for col in data_row)
-        for data_row in dataframe.itertuples(index=False)
+        tuple(row)
+        for row in dataframe[[field.name for field in schema]]
+        .astype(object)
+        .to_numpy(na_value=None)
     ]
 
-    # Use query to fetch rows instead of listing directly from the table so
-    # that we get values from the streaming buffer "within a few seconds".
-    # https://cloud.google.com/bigquery/streaming-data-into-bigquery#dataavailability
-    @google.api_core.retry.Retry(
-        predicate=google.api_core.retry.if_exception_type(MissingDataError)
+    rows = _query_streamed_rows(
+        bigquery_client,
+        f"SELECT * FROM `{table.project}.{table.dataset_id}.{table.table_id}` "
+        "ORDER BY int_col",
+        len(expected),
     )
-    def get_rows():
-        rows = list(
-            bigquery_client.query(
-                "SELECT * FROM `{}.{}.{}`".format(
-                    table.project, table.dataset_id, table.table_id
-                )
-            )
-        )
-        if len(rows) != len(expected):
-            raise MissingDataError()
-        return rows
-
-    rows = get_rows()
-    sorted_rows = sorted(rows, key=operator.attrgetter("int_col"))
-    row_tuples = [r.values() for r in sorted_rows]
-
-    for row, expected_row in zip(row_tuples, expected):
-        assert (
-            # Use Counter to verify the same number of values in each, because
-            # column order does not matter.
-            collections.Counter(row)
-            == collections.Counter(expected_row)
-        )
-
-
-def test_nested_table_to_dataframe(bigquery_client, dataset_id):
+    row_tuples = [tuple(r.values()) for r in rows]
+
+    assert row_tuples == expected
+
+
+_NESTED_SCHEMA = [
+    bigquery.SchemaField("string_col", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField(
+        "record_col",
+        "RECORD",
+        mode="NULLABLE",
+        fields=[
+            bigquery.SchemaField("nested_string", "STRING", mode="NULLABLE"),
+            bigquery.SchemaField("nested_repeated", "INTEGER", mode="REPEATED"),
+            bigquery.SchemaField(
+                "nested_record",
+                "RECORD",
+                mode="NULLABLE",
+                fields=[
+                    bigquery.SchemaField(
+                        "nested_nested_string", "STRING", mode="NULLABLE"
+                    )
+                ],
+            ),
+        ],
+    ),
+    bigquery.SchemaField("bigfloat_col", "FLOAT", mode="NULLABLE"),
+    bigquery.SchemaField("smallfloat_col", "FLOAT", mode="NULLABLE"),
+]
+_NESTED_RECORD = {
+    "nested_string": "another string value",
+    "nested_repeated": [0, 1, 2],
+    "nested_record": {"nested_nested_string": "some deep insight"},
+}
+
+
+@pytest.fixture(scope="module")
+def nested_table(bigquery_client, table_id_prefix):
     from google.cloud.bigquery.job import SourceFormat
     from google.cloud.bigquery.job import WriteDisposition
 
-    SF = bigquery.SchemaField
-    schema = [
-        SF("string_col", "STRING", mode="NULLABLE"),
-        SF(
-            "record_col",
-            "RECORD",
-            mode="NULLABLE",
-            fields=[
-                SF("nested_string", "STRING", mode="NULLABLE"),
-                SF("nested_repeated", "INTEGER", mode="REPEATED"),
-                SF(
-                    "nested_record",
-                    "RECORD",
-                    mode="NULLABLE",
-                    fields=[SF("nested_nested_string", "STRING", mode="NULLABLE")],
-                ),
-            ],
-        ),
-        SF("bigfloat_col", "FLOAT", mode="NULLABLE"),
-        SF("smallfloat_col", "FLOAT", mode="NULLABLE"),
-    ]
-    record = {
-        "nested_string": "another string value",
-        "nested_repeated": [0, 1, 2],
-        "nested_record": {"nested_nested_string": "some deep insight"},
-    }
     to_insert = [
         {
             "string_col": "Some value",
-            "record_col": record,
+            "record_col": _NESTED_RECORD,
             "bigfloat_col": 3.14,
             "smallfloat_col": 2.72,
         }
     ]
-    rows = [json.dumps(row) for row in to_insert]
-    body = io.BytesIO("{}\n".format("\n".join(rows)).encode("ascii"))
-    table_id = f"{bigquery_client.project}.{dataset_id}.test_nested_table_to_dataframe"
+    body = io.BytesIO()
+    for row in to_insert:
+        body.write(json.dumps(row).encode("ascii"))
+        body.write(b"\n")
+    body.seek(0)
+    table_id = f"{table_id_prefix}.test_nested_table_to_dataframe"
     job_config = bigquery.LoadJobConfig()
     job_config.write_disposition = WriteDisposition.WRITE_TRUNCATE
     job_config.source_format = SourceFormat.NEWLINE_DELIMITED_JSON
-    job_config.schema = schema
+    job_config.schema = _NESTED_SCHEMA
     # Load a table using a local JSON file from memory.
     bigquery_client.load_table_from_file(body, table_id, job_config=job_config).result()
+    return table_id
 
-    df = bigquery_client.list_rows(table_id, selected_fields=schema).to_dataframe(
-        dtypes={"smallfloat_col": "float16"}
-    )
+
+def test_nested_table_to_dataframe(bigquery_client, nested_table):
+    df = bigquery_client.list_rows(
+        nested_table, selected_fields=_NESTED_SCHEMA
+    ).to_dataframe(dtypes={"smallfloat_col": "float16"})
 
     assert isinstance(df, pandas.DataFrame)
     assert len(df) == 1  # verify the number of rows
@@ -1015,7 +990,7 @@ def test_nested_table_to_dataframe(bigquery_client, dataset_id):
     row = df.iloc[0]
     # verify the row content
     assert row["string_col"] == "Some value"
-    expected_keys = tuple(sorted(record.keys()))
+    expected_keys = tuple(sorted(_NESTED_RECORD.keys()))
     row_keys = tuple(sorted(row["record_col"].keys()))
     assert row_keys == expected_keys
     # Can't compare numpy arrays, which pyarrow encodes the embedded
@@ -1032,13 +1007,10 @@ def test_nested_table_to_dataframe(bigquery_client, dataset_id):
     assert df.dtypes["smallfloat_col"].name == "float16"
 
 
-def test_list_rows_max_results_w_bqstorage(bigquery_client):
+def test_list_rows_max_results_w_bqstorage(bigquery_client, bqstorage_client):
     table_ref = bigquery.DatasetReference("bigquery-public-data", "utility_us").table(
         "country_code_iso"
     )
-    bqstorage_client = bigquery_storage.BigQueryReadClient(
-        credentials=bigquery_client._credentials
-    )
 
     row_iterator = bigquery_client.list_rows(
         table_ref,
@@ -1053,7 +1025,7 @@ def test_list_rows_max_results_w_bqstorage(bigquery_client):
     assert len(dataframe.index) == 100
 
 
-@pytest.mark.skipif(PANDAS_INSTALLED_VERSION[0:2] not in ["0.", "1."], reason="")
+@pytest.mark.skipif(PANDAS_INSTALLED_VERSION.major >= 2, reason="")
 @pytest.mark.parametrize(
     ("max_results",),
     (
@@ -1062,27 +1034,10 @@ def test_list_rows_max_results_w_bqstorage(bigquery_client):
     ),  # Use BQ Storage API.  # Use REST API.
 )
 def test_list_rows_nullable_scalars_dtypes(bigquery_client, scalars_table, max_results):
-    # TODO(GH#836): Avoid INTERVAL columns until they are supported by the
-    # BigQuery Storage API and pyarrow.
-    schema = [
-        bigquery.SchemaField("bool_col", enums.SqlTypeNames.BOOLEAN),
-        bigquery.SchemaField("bignumeric_col", enums.SqlTypeNames.BIGNUMERIC),
-        bigquery.SchemaField("bytes_col", enums.SqlTypeNames.BYTES),
-        bigquery.SchemaField("date_col", enums.SqlTypeNames.DATE),
-        bigquery.SchemaField("datetime_col", enums.SqlTypeNames.DATETIME),
-        bigquery.SchemaField("float64_col", enums.SqlTypeNames.FLOAT64),
-        bigquery.SchemaField("geography_col", enums.SqlTypeNames.GEOGRAPHY),
-        bigquery.SchemaField("int64_col", enums.SqlTypeNames.INT64),
-        bigquery.SchemaField("numeric_col", enums.SqlTypeNames.NUMERIC),
-        bigquery.SchemaField("string_col", enums.SqlTypeNames.STRING),
-        bigquery.SchemaField("time_col", enums.SqlTypeNames.TIME),
-        bigquery.SchemaField("timestamp_col", enums.SqlTypeNames.TIMESTAMP),
-    ]
-
     df = bigquery_client.list_rows(
         scalars_table,
         max_results=max_results,
-        selected_fields=schema,
+        selected_fields=_SCALARS_SCHEMA,
     ).to_dataframe()
 
     assert df.dtypes["bool_col"].name == "boolean"
@@ -1112,27 +1067,10 @@ def test_list_rows_nullable_scalars_dtypes(bigquery_client, scalars_table, max_r
 def test_list_rows_nullable_scalars_extreme_dtypes(
     bigquery_client, scalars_extreme_table, max_results
 ):
-    # TODO(GH#836): Avoid INTERVAL columns until they are supported by the
-    # BigQuery Storage API and pyarrow.
-    schema = [
-        bigquery.SchemaField("bool_col", enums.SqlTypeNames.BOOLEAN),
-        bigquery.SchemaField("bignumeric_col", enums.SqlTypeNames.BIGNUMERIC),
-        bigquery.SchemaField("bytes_col", enums.SqlTypeNames.BYTES),
-        bigquery.SchemaField("date_col", enums.SqlTypeNames.DATE),
-        bigquery.SchemaField("datetime_col", enums.SqlTypeNames.DATETIME),
-        bigquery.SchemaField("float64_col", enums.SqlTypeNames.FLOAT64),
-        bigquery.SchemaField("geography_col", enums.SqlTypeNames.GEOGRAPHY),
-        bigquery.SchemaField("int64_col", enums.SqlTypeNames.INT64),
-        bigquery.SchemaField("numeric_col", enums.SqlTypeNames.NUMERIC),
-        bigquery.SchemaField("string_col", enums.SqlTypeNames.STRING),
-        bigquery.SchemaField("time_col", enums.SqlTypeNames.TIME),
-        bigquery.SchemaField("timestamp_col", enums.SqlTypeNames.TIMESTAMP),
-    ]
-
     df = bigquery_client.list_rows(
         scalars_extreme_table,
         max_results=max_results,
-        selected_fields=schema,
+        selected_fields=_SCALARS_SCHEMA,
     ).to_dataframe()
 
     # Extreme values are out-of-bounds for pandas datetime64 values, which use
@@ -1168,27 +1106,10 @@ def test_list_rows_nullable_scalars_extreme_dtypes(
 def test_list_rows_nullable_scalars_extreme_dtypes_w_custom_dtype(
     bigquery_client, scalars_extreme_table, max_results
 ):
-    # TODO(GH#836): Avoid INTERVAL columns until they are supported by the
-    # BigQuery Storage API and pyarrow.
-    schema = [
-        bigquery.SchemaField("bool_col", enums.SqlTypeNames.BOOLEAN),
-        bigquery.SchemaField("bignumeric_col", enums.SqlTypeNames.BIGNUMERIC),
-        bigquery.SchemaField("bytes_col", enums.SqlTypeNames.BYTES),
-        bigquery.SchemaField("date_col", enums.SqlTypeNames.DATE),
-        bigquery.SchemaField("datetime_col", enums.SqlTypeNames.DATETIME),
-        bigquery.SchemaField("float64_col", enums.SqlTypeNames.FLOAT64),
-        bigquery.SchemaField("geography_col", enums.SqlTypeNames.GEOGRAPHY),
-        bigquery.SchemaField("int64_col", enums.SqlTypeNames.INT64),
-        bigquery.SchemaField("numeric_col", enums.SqlTypeNames.NUMERIC),
-        bigquery.SchemaField("string_col", enums.SqlTypeNames.STRING),
-        bigquery.SchemaField("time_col", enums.SqlTypeNames.TIME),
-        bigquery.SchemaField("timestamp_col", enums.SqlTypeNames.TIMESTAMP),
-    ]
-
     df = bigquery_client.list_rows(
         scalars_extreme_table,
         max_results=max_results,
-        selected_fields=schema,
+        selected_fields=_SCALARS_SCHEMA,
     ).to_dataframe(
         bool_dtype=pandas.BooleanDtype(),
         int_dtype=pandas.Int64Dtype(),
@@ -1259,7 +1180,7 @@ def test_upload_time_and_datetime_56(bigquery_client, dataset_id):
     df = pandas.DataFrame(
         dict(
             dt=[
-                datetime.datetime(2020, 1, 8, 8, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2020, 1, 8, 8, 0, 0, tzinfo=_UTC),
                 datetime.datetime(
                     2020,
                     1,
@@ -1273,30 +1194,47 @@ def test_upload_time_and_datetime_56(bigquery_client, dataset_id):
             t=[datetime.time(0, 0, 10, 100001), None],
         )
     )
-    table = f"{dataset_id}.test_upload_time_and_datetime"
-    bigquery_client.load_table_from_dataframe(df, table).result()
-    data = list(map(list, bigquery_client.list_rows(table)))
-    assert data == [
-        [
-            datetime.datetime(2020, 1, 8, 8, 0, tzinfo=datetime.timezone.utc),
-            datetime.time(0, 0, 10, 100001),
-        ],
-        [datetime.datetime(2020, 1, 8, 15, 0, tzinfo=datetime.timezone.utc), None],
-    ]
-
     from google.cloud.bigquery import job, schema
 
-    table = f"{dataset_id}.test_upload_time_and_datetime_dt"
+    table = f"{dataset_id}.test_upload_time_and_datetime"
+    table_dt = f"{dataset_id}.test_upload_time_and_datetime_dt"
     config = job.LoadJobConfig(
         schema=[schema.SchemaField("dt", "DATETIME"), schema.SchemaField("t", "TIME")]
     )
 
-    bigquery_client.load_table_from_dataframe(df, table, job_config=config).result()
-    data = list(map(list, bigquery_client.list_rows(table)))
-    assert data == [
-        [datetime.datetime(2020, 1, 8, 8, 0), datetime.time(0, 0, 10, 100001)],
-        [datetime.datetime(2020, 1, 8, 15, 0), None],
-    ]
+    # The load jobs are independent, so start both before waiting on either.
+    load_job = bigquery_client.load_table_from_dataframe(df, table)
+    load_job_dt = bigquery_client.load_table_from_dataframe(
+        df, table_dt, job_config=config
+    )
+    load_job.result()
+    load_job_dt.result()
+
+    data = (
+        bigquery_client.list_rows(table)
+        .to_arrow(create_bqstorage_client=False)
+        .to_pydict()
+    )
+    assert data == {
+        "dt": [
+            datetime.datetime(2020, 1, 8, 8, 0, tzinfo=_UTC),
+            datetime.datetime(2020, 1, 8, 15, 0, tzinfo=_UTC),
+        ],
+        "t": [datetime.time(0, 0, 10, 100001), None],
+    }
+
+    data = (
+        bigquery_client.list_rows(table_dt)
+        .to_arrow(create_bqstorage_client=False)
+        .to_pydict()
+    )
+    assert data == {
+        "dt": [
+            datetime.datetime(2020, 1, 8, 8, 0),
+            datetime.datetime(2020, 1, 8, 15, 0),
+        ],
+        "t": [datetime.time(0, 0, 10, 100001), None],
+    }
 
 
 def test_to_dataframe_query_with_empty_results(bigquery_client):
@@ -1325,45 +1263,40 @@ def test_to_dataframe_query_with_empty_results(bigquery_client):
     assert len(df.index) == 0
 
 
-def test_to_dataframe_geography_as_objects(bigquery_client, dataset_id):
-    wkt = pytest.importorskip("shapely.wkt")
+@pytest.fixture(scope="module")
+def geography_table(bigquery_client, dataset_id):
+    table_id = f"{dataset_id}.geolake"
     bigquery_client.query(
-        f"create table {dataset_id}.lake (name string, geog geography)"
+        f"create table {table_id} (name string, geog geography)"
     ).result()
     bigquery_client.query(
         f"""
-        insert into {dataset_id}.lake (name, geog) values
+        insert into {table_id} (name, geog) values
         ('foo', st_geogfromtext('point(0 0)')),
-        ('bar', st_geogfromtext('point(0 1)')),
+        ('bar', st_geogfromtext('polygon((0 0, 1 0, 1 1, 0 0))')),
         ('baz', null)
         """
     ).result()
+    return table_id
+
+
+def test_to_dataframe_geography_as_objects(bigquery_client, geography_table):
+    wkt = pytest.importorskip("shapely.wkt")
     df = bigquery_client.query(
-        f"select * from {dataset_id}.lake order by name"
+        f"select * from {geography_table} order by name"
     ).to_dataframe(geography_as_object=True)
     assert list(df["name"]) == ["bar", "baz", "foo"]
-    assert df["geog"][0] == wkt.loads("point(0 1)")
+    assert df["geog"][0] == wkt.loads("polygon((0 0, 1 0, 1 1, 0 0))")
     assert pandas.isna(df["geog"][1])
     assert df["geog"][2] == wkt.loads("point(0 0)")
 
 
-def test_to_geodataframe(bigquery_client, dataset_id):
+def test_to_geodataframe(bigquery_client, geography_table):
     geopandas = pytest.importorskip("geopandas")
     from shapely import wkt
 
-    bigquery_client.query(
-        f"create table {dataset_id}.geolake (name string, geog geography)"
-    ).result()
-    bigquery_client.query(
-        f"""
-        insert into {dataset_id}.geolake (name, geog) values
-        ('foo', st_geogfromtext('point(0 0)')),
-        ('bar', st_geogfromtext('polygon((0 0, 1 0, 1 1, 0 0))')),
-        ('baz', null)
-        """
-    ).result()
     df = bigquery_client.query(
-        f"select * from {dataset_id}.geolake order by name"
+        f"select * from {geography_table} order by name"
     ).to_geodataframe()
     assert df["geog"][0] == wkt.loads("polygon((0 0, 1 0, 1 1, 0 0))")
     assert pandas.isna(df["geog"][1])
@@ -341,6 +341,24 @@ def test_range_to_py_w_wrong_format(object_under_test):
         object_under_test.range_to_py("[2009-06-172019-06-17)", range_field)
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "[2009-06-17, 2019-06-17)trailing",
+        "[2009-06-17, 2019-06-17, 2029-06-17)",
+        "2009-06-17, 2019-06-17)",
+    ],
+)
+def test_range_to_py_w_malformed_literal(object_under_test, value):
+    range_field = create_field(
+        "NULLABLE",
+        "RANGE",
+        range_element_type="DATE",
+    )
+    with pytest.raises(ValueError, match="unknown format for range value"):
+        object_under_test.range_to_py(value, range_field)
+
+
 def test_range_to_py_w_wrong_element_type(object_under_test):
     range_field = create_field(
         "NULLABLE",
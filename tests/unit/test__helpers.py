@@ -14,119 +14,142 @@
 
 import datetime
 import decimal
-import json
-import os
-import warnings
+import functools
 import pytest
 import packaging
 import unittest
 from unittest import mock
 
 import google.api_core
-from google.cloud.bigquery._helpers import _isinstance_or_raise
+from google.cloud._helpers import UTC
+from google.cloud.bigquery._helpers import (
+    BIGQUERY_EMULATOR_HOST,
+    _bool_to_json,
+    _bytes_to_json,
+    _date_to_json,
+    _datetime_to_json,
+    _decimal_to_json,
+    _DEFAULT_HOST,
+    _del_sub_prop,
+    _field_to_index_mapping,
+    _field_to_json,
+    _float_to_json,
+    _get_bigquery_host,
+    _get_client_universe,
+    _get_sub_prop,
+    _int_or_none,
+    _int_to_json,
+    _isinstance_or_raise,
+    _not_null,
+    _range_field_to_json,
+    _record_field_to_json,
+    _repeated_field_to_json,
+    _row_tuple_from_json,
+    _rows_from_json,
+    _SCALAR_VALUE_TO_JSON_ROW,
+    _scalar_field_to_json,
+    _set_sub_prop,
+    _single_field_to_json,
+    _snake_to_camel_case,
+    _str_or_none,
+    _time_to_json,
+    _timestamp_to_json_parameter,
+    _timestamp_to_json_row,
+    _validate_universe,
+)
+from google.cloud.bigquery.schema import SchemaField
+
+from .helpers import make_creds
+
+_API_CORE_LT_2_15 = packaging.version.parse(
+    getattr(google.api_core, "__version__", "0.0.0")
+) < packaging.version.Version("2.15.0")
+
+
+@pytest.fixture(scope="module")
+def empty_client_options():
+    from google.api_core import client_options
+
+    return client_options.from_dict({})
+
+
+@pytest.fixture(scope="module")
+def foo_client_options():
+    from google.api_core import client_options
+
+    return client_options.from_dict({"universe_domain": "foo.com"})
 
 
 @pytest.mark.skipif(
-    packaging.version.parse(getattr(google.api_core, "__version__", "0.0.0"))
-    < packaging.version.Version("2.15.0"),
+    _API_CORE_LT_2_15,
     reason="universe_domain not supported with google-api-core < 2.15.0",
 )
-class Test_get_client_universe(unittest.TestCase):
+class Test_get_client_universe:
     def test_with_none(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
-
-        self.assertEqual("googleapis.com", _get_client_universe(None))
+        assert _get_client_universe(None) == "googleapis.com"
 
     def test_with_dict(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
-
         options = {"universe_domain": "foo.com"}
-        self.assertEqual("foo.com", _get_client_universe(options))
+        assert _get_client_universe(options) == "foo.com"
 
     def test_with_dict_empty(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
-
         options = {"universe_domain": ""}
-        self.assertEqual("googleapis.com", _get_client_universe(options))
+        assert _get_client_universe(options) == "googleapis.com"
 
-    def test_with_client_options(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
-        from google.api_core import client_options
+    def test_with_client_options(self, foo_client_options):
+        assert _get_client_universe(foo_client_options) == "foo.com"
 
-        options = client_options.from_dict({"universe_domain": "foo.com"})
-        self.assertEqual("foo.com", _get_client_universe(options))
-
-    @mock.patch.dict(os.environ, {"GOOGLE_CLOUD_UNIVERSE_DOMAIN": "foo.com"})
-    def test_with_environ(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
-
-        self.assertEqual("foo.com", _get_client_universe(None))
-
-    @mock.patch.dict(os.environ, {"GOOGLE_CLOUD_UNIVERSE_DOMAIN": "foo.com"})
-    def test_with_environ_and_dict(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
+    def test_with_environ(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_CLOUD_UNIVERSE_DOMAIN", "foo.com")
+        assert _get_client_universe(None) == "foo.com"
 
+    def test_with_environ_and_dict(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_CLOUD_UNIVERSE_DOMAIN", "foo.com")
         options = ({"credentials_file": "file.json"},)
-        self.assertEqual("foo.com", _get_client_universe(options))
+        assert _get_client_universe(options) == "foo.com"
 
-    @mock.patch.dict(os.environ, {"GOOGLE_CLOUD_UNIVERSE_DOMAIN": "foo.com"})
-    def test_with_environ_and_empty_options(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
-        from google.api_core import client_options
+    def test_with_environ_and_empty_options(self, monkeypatch, empty_client_options):
+        monkeypatch.setenv("GOOGLE_CLOUD_UNIVERSE_DOMAIN", "foo.com")
+        assert _get_client_universe(empty_client_options) == "foo.com"
 
-        options = client_options.from_dict({})
-        self.assertEqual("foo.com", _get_client_universe(options))
+    def test_with_environ_empty(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_CLOUD_UNIVERSE_DOMAIN", "")
+        assert _get_client_universe(None) == "googleapis.com"
 
-    @mock.patch.dict(os.environ, {"GOOGLE_CLOUD_UNIVERSE_DOMAIN": ""})
-    def test_with_environ_empty(self):
-        from google.cloud.bigquery._helpers import _get_client_universe
 
-        self.assertEqual("googleapis.com", _get_client_universe(None))
+# _validate_universe only reads universe_domain, so the tests share these.
+_CREDS_WO_UNIVERSE = make_creds(None)
+_CREDS_GOOGLEAPIS = make_creds("googleapis.com")
+_CREDS_FOO = make_creds("foo.com")
 
 
 class Test_validate_universe(unittest.TestCase):
     def test_with_none(self):
-        from google.cloud.bigquery._helpers import _validate_universe
-
         # should not raise
         _validate_universe("googleapis.com", None)
 
     def test_with_no_universe_creds(self):
-        from google.cloud.bigquery._helpers import _validate_universe
-        from .helpers import make_creds
-
-        creds = make_creds(None)
         # should not raise
-        _validate_universe("googleapis.com", creds)
+        _validate_universe("googleapis.com", _CREDS_WO_UNIVERSE)
 
     def test_with_matched_universe_creds(self):
-        from google.cloud.bigquery._helpers import _validate_universe
-        from .helpers import make_creds
-
-        creds = make_creds("googleapis.com")
         # should not raise
-        _validate_universe("googleapis.com", creds)
+        _validate_universe("googleapis.com", _CREDS_GOOGLEAPIS)
 
     def test_with_mismatched_universe_creds(self):
-        from google.cloud.bigquery._helpers import _validate_universe
-        from .helpers import make_creds
-
-        creds = make_creds("foo.com")
         with self.assertRaises(ValueError):
-            _validate_universe("googleapis.com", creds)
+            _validate_universe("googleapis.com", _CREDS_FOO)
 
 
 class Test_not_null(unittest.TestCase):
     def _call_fut(self, value, field):
-        from google.cloud.bigquery._helpers import _not_null
-
         return _not_null(value, field)
 
     def test_w_none_nullable(self):
-        self.assertFalse(self._call_fut(None, _Field("NULLABLE")))
+        self.assertFalse(self._call_fut(None, _make_field("UNKNOWN", mode="NULLABLE")))
 
     def test_w_none_required(self):
-        self.assertTrue(self._call_fut(None, _Field("REQUIRED")))
+        self.assertTrue(self._call_fut(None, _make_field("UNKNOWN", mode="REQUIRED")))
 
     def test_w_value(self):
         self.assertTrue(self._call_fut(object(), object()))
@@ -134,8 +157,6 @@ class Test_not_null(unittest.TestCase):
 
 class Test_field_to_index_mapping(unittest.TestCase):
     def _call_fut(self, schema):
-        from google.cloud.bigquery._helpers import _field_to_index_mapping
-
         return _field_to_index_mapping(schema)
 
     def test_w_empty_schema(self):
@@ -143,87 +164,81 @@ class Test_field_to_index_mapping(unittest.TestCase):
 
     def test_w_non_empty_schema(self):
         schema = [
-            _Field("REPEATED", "first", "INTEGER"),
-            _Field("REQUIRED", "second", "INTEGER"),
-            _Field("REPEATED", "third", "INTEGER"),
+            _make_field("INTEGER", mode="REPEATED", name="first"),
+            _make_field("INTEGER", mode="REQUIRED", name="second"),
+            _make_field("INTEGER", mode="REPEATED", name="third"),
         ]
         self.assertEqual(self._call_fut(schema), {"first": 0, "second": 1, "third": 2})
 
 
-class Test_row_tuple_from_json(unittest.TestCase):
-    def _call_fut(self, row, schema):
-        from google.cloud.bigquery._helpers import _row_tuple_from_json
+def _json_cell(value):
+    """Build a tabledata.list cell: lists are arrays, tuples are structs."""
+    if isinstance(value, list):
+        return {"v": [_json_cell(item) for item in value]}
+    if isinstance(value, tuple):
+        return {"v": {"f": [_json_cell(item) for item in value]}}
+    return {"v": value}
 
-        with _field_isinstance_patcher():
-            return _row_tuple_from_json(row, schema)
 
-    def test_w_single_scalar_column(self):
+# SELECT ([1, 2], 3, [4, 5]) as col
+_STRUCT_W_NESTED_ARRAY_ROW = {"f": [_json_cell((["1", "2"], "3", ["4", "5"]))]}
+
+
+@pytest.mark.parametrize(
+    ("mode", "field_type", "value", "expected"),
+    [
         # SELECT 1 AS col
-        col = _Field("REQUIRED", "col", "INTEGER")
-        row = {"f": [{"v": "1"}]}
-        self.assertEqual(self._call_fut(row, schema=[col]), (1,))
+        ("REQUIRED", "INTEGER", "1", 1),
+        # SELECT ST_GEOGPOINT(1, 2) AS col
+        ("REQUIRED", "GEOGRAPHY", "POINT(1, 2)", "POINT(1, 2)"),
+        # SELECT [1, 2, 3] AS col
+        ("REPEATED", "INTEGER", ["1", "2", "3"], [1, 2, 3]),
+    ],
+    ids=["scalar", "geography", "array"],
+)
+def test_row_tuple_from_json_w_single_column(mode, field_type, value, expected):
+    col = _make_field(field_type, mode=mode, name="col")
+    row = {"f": [_json_cell(value)]}
+    assert _row_tuple_from_json(row, [col]) == (expected,)
+
+
+class Test_row_tuple_from_json(unittest.TestCase):
+    def _call_fut(self, row, schema):
+        return _row_tuple_from_json(row, schema)
 
     def test_w_unknown_type(self):
         # SELECT 1 AS col
-        col = _Field("REQUIRED", "col", "UNKNOWN")
+        col = _make_field("UNKNOWN", mode="REQUIRED", name="col")
         row = {"f": [{"v": "1"}]}
-        with warnings.catch_warnings(record=True) as warned:
+        with pytest.warns(FutureWarning, match="'UNKNOWN' for field 'col'") as warned:
             self.assertEqual(self._call_fut(row, schema=[col]), ("1",))
         self.assertEqual(len(warned), 1)
-        warning = warned[0]
-        self.assertTrue("UNKNOWN" in str(warning))
-        self.assertTrue("col" in str(warning))
-
-    def test_w_single_scalar_geography_column(self):
-        # SELECT 1 AS col
-        col = _Field("REQUIRED", "geo", "GEOGRAPHY")
-        row = {"f": [{"v": "POINT(1, 2)"}]}
-        self.assertEqual(self._call_fut(row, schema=[col]), ("POINT(1, 2)",))
 
     def test_w_single_struct_column(self):
         # SELECT (1, 2) AS col
-        sub_1 = _Field("REQUIRED", "sub_1", "INTEGER")
-        sub_2 = _Field("REQUIRED", "sub_2", "INTEGER")
-        col = _Field("REQUIRED", "col", "RECORD", fields=[sub_1, sub_2])
+        sub_1 = _make_field("INTEGER", mode="REQUIRED", name="sub_1")
+        sub_2 = _make_field("INTEGER", mode="REQUIRED", name="sub_2")
+        col = _make_field("RECORD", mode="REQUIRED", name="col", fields=[sub_1, sub_2])
         row = {"f": [{"v": {"f": [{"v": "1"}, {"v": "2"}]}}]}
         self.assertEqual(self._call_fut(row, schema=[col]), ({"sub_1": 1, "sub_2": 2},))
 
-    def test_w_single_array_column(self):
-        # SELECT [1, 2, 3] as col
-        col = _Field("REPEATED", "col", "INTEGER")
-        row = {"f": [{"v": [{"v": "1"}, {"v": "2"}, {"v": "3"}]}]}
-        self.assertEqual(self._call_fut(row, schema=[col]), ([1, 2, 3],))
-
     def test_w_unknown_type_repeated(self):
         # SELECT 1 AS col
-        col = _Field("REPEATED", "col", "UNKNOWN")
+        col = _make_field("UNKNOWN", mode="REPEATED", name="col")
         row = {"f": [{"v": [{"v": "1"}, {"v": "2"}, {"v": "3"}]}]}
-        with warnings.catch_warnings(record=True) as warned:
+        with pytest.warns(FutureWarning, match="'UNKNOWN' for field 'col'") as warned:
             self.assertEqual(self._call_fut(row, schema=[col]), (["1", "2", "3"],))
-        self.assertEqual(len(warned), 1)
-        warning = warned[0]
-        self.assertTrue("UNKNOWN" in str(warning))
-        self.assertTrue("col" in str(warning))
+        self.assertEqual(len(warned), 3)  # 1 warning per repeated value.
 
     def test_w_struct_w_nested_array_column(self):
         # SELECT ([1, 2], 3, [4, 5]) as col
-        first = _Field("REPEATED", "first", "INTEGER")
-        second = _Field("REQUIRED", "second", "INTEGER")
-        third = _Field("REPEATED", "third", "INTEGER")
-        col = _Field("REQUIRED", "col", "RECORD", fields=[first, second, third])
-        row = {
-            "f": [
-                {
-                    "v": {
-                        "f": [
-                            {"v": [{"v": "1"}, {"v": "2"}]},
-                            {"v": "3"},
-                            {"v": [{"v": "4"}, {"v": "5"}]},
-                        ]
-                    }
-                }
-            ]
-        }
+        first = _make_field("INTEGER", mode="REPEATED", name="first")
+        second = _make_field("INTEGER", mode="REQUIRED", name="second")
+        third = _make_field("INTEGER", mode="REPEATED", name="third")
+        col = _make_field(
+            "RECORD", mode="REQUIRED", name="col", fields=[first, second, third]
+        )
+        row = _STRUCT_W_NESTED_ARRAY_ROW
         self.assertEqual(
             self._call_fut(row, schema=[col]),
             ({"first": [1, 2], "second": 3, "third": [4, 5]},),
@@ -231,30 +246,21 @@ class Test_row_tuple_from_json(unittest.TestCase):
 
     def test_w_unknown_type_subfield(self):
         # SELECT [(1, 2, 3), (4, 5, 6)] as col
-        first = _Field("REPEATED", "first", "UNKNOWN1")
-        second = _Field("REQUIRED", "second", "UNKNOWN2")
-        third = _Field("REPEATED", "third", "INTEGER")
-        col = _Field("REQUIRED", "col", "RECORD", fields=[first, second, third])
-        row = {
-            "f": [
-                {
-                    "v": {
-                        "f": [
-                            {"v": [{"v": "1"}, {"v": "2"}]},
-                            {"v": "3"},
-                            {"v": [{"v": "4"}, {"v": "5"}]},
-                        ]
-                    }
-                }
-            ]
-        }
-        with warnings.catch_warnings(record=True) as warned:
+        first = _make_field("UNKNOWN1", mode="REPEATED", name="first")
+        second = _make_field("UNKNOWN2", mode="REQUIRED", name="second")
+        third = _make_field("INTEGER", mode="REPEATED", name="third")
+        col = _make_field(
+            "RECORD", mode="REQUIRED", name="col", fields=[first, second, third]
+        )
+        row = _STRUCT_W_NESTED_ARRAY_ROW
+        with pytest.warns(FutureWarning) as warned:
             self.assertEqual(
                 self._call_fut(row, schema=[col]),
                 ({"first": ["1", "2"], "second": "3", "third": [4, 5]},),
             )
-        self.assertEqual(len(warned), 2)  # 1 warning per unknown field.
-        warned = [str(warning) for warning in warned]
+        # 1 warning per unknown value: 2 for "first" and 1 for "second".
+        self.assertEqual(len(warned), 3)
+        warned = [str(warning.message) for warning in warned]
         self.assertTrue(
             any(["first" in warning and "UNKNOWN1" in warning for warning in warned])
         )
@@ -264,20 +270,13 @@ class Test_row_tuple_from_json(unittest.TestCase):
 
     def test_w_array_of_struct(self):
         # SELECT [(1, 2, 3), (4, 5, 6)] as col
-        first = _Field("REQUIRED", "first", "INTEGER")
-        second = _Field("REQUIRED", "second", "INTEGER")
-        third = _Field("REQUIRED", "third", "INTEGER")
-        col = _Field("REPEATED", "col", "RECORD", fields=[first, second, third])
-        row = {
-            "f": [
-                {
-                    "v": [
-                        {"v": {"f": [{"v": "1"}, {"v": "2"}, {"v": "3"}]}},
-                        {"v": {"f": [{"v": "4"}, {"v": "5"}, {"v": "6"}]}},
-                    ]
-                }
-            ]
-        }
+        first = _make_field("INTEGER", mode="REQUIRED", name="first")
+        second = _make_field("INTEGER", mode="REQUIRED", name="second")
+        third = _make_field("INTEGER", mode="REQUIRED", name="third")
+        col = _make_field(
+            "RECORD", mode="REPEATED", name="col", fields=[first, second, third]
+        )
+        row = {"f": [_json_cell([("1", "2", "3"), ("4", "5", "6")])]}
         self.assertEqual(
             self._call_fut(row, schema=[col]),
             (
@@ -290,26 +289,10 @@ class Test_row_tuple_from_json(unittest.TestCase):
 
     def test_w_array_of_struct_w_array(self):
         # SELECT [([1, 2, 3], 4), ([5, 6], 7)]
-        first = _Field("REPEATED", "first", "INTEGER")
-        second = _Field("REQUIRED", "second", "INTEGER")
-        col = _Field("REPEATED", "col", "RECORD", fields=[first, second])
-        row = {
-            "f": [
-                {
-                    "v": [
-                        {
-                            "v": {
-                                "f": [
-                                    {"v": [{"v": "1"}, {"v": "2"}, {"v": "3"}]},
-                                    {"v": "4"},
-                                ]
-                            }
-                        },
-                        {"v": {"f": [{"v": [{"v": "5"}, {"v": "6"}]}, {"v": "7"}]}},
-                    ]
-                }
-            ]
-        }
+        first = _make_field("INTEGER", mode="REPEATED", name="first")
+        second = _make_field("INTEGER", mode="REQUIRED", name="second")
+        col = _make_field("RECORD", mode="REPEATED", name="col", fields=[first, second])
+        row = {"f": [_json_cell([(["1", "2", "3"], "4"), (["5", "6"], "7")])]}
         self.assertEqual(
             self._call_fut(row, schema=[col]),
             ([{"first": [1, 2, 3], "second": 4}, {"first": [5, 6], "second": 7}],),
@@ -318,22 +301,22 @@ class Test_row_tuple_from_json(unittest.TestCase):
 
 class Test_rows_from_json(unittest.TestCase):
     def _call_fut(self, rows, schema):
-        from google.cloud.bigquery._helpers import _rows_from_json
-
-        with _field_isinstance_patcher():
-            return _rows_from_json(rows, schema)
+        return _rows_from_json(rows, schema)
 
     def test_w_record_subfield(self):
         from google.cloud.bigquery.table import Row
 
-        full_name = _Field("REQUIRED", "full_name", "STRING")
-        area_code = _Field("REQUIRED", "area_code", "STRING")
-        local_number = _Field("REQUIRED", "local_number", "STRING")
-        rank = _Field("REQUIRED", "rank", "INTEGER")
-        phone = _Field(
-            "NULLABLE", "phone", "RECORD", fields=[area_code, local_number, rank]
+        full_name = _make_field("STRING", mode="REQUIRED", name="full_name")
+        area_code = _make_field("STRING", mode="REQUIRED", name="area_code")
+        local_number = _make_field("STRING", mode="REQUIRED", name="local_number")
+        rank = _make_field("INTEGER", mode="REQUIRED", name="rank")
+        phone = _make_field(
+            "RECORD",
+            mode="NULLABLE",
+            name="phone",
+            fields=[area_code, local_number, rank],
         )
-        color = _Field("REPEATED", "color", "STRING")
+        color = _make_field("STRING", mode="REPEATED", name="color")
         schema = [full_name, phone, color]
         rows = [
             {
@@ -367,10 +350,10 @@ class Test_rows_from_json(unittest.TestCase):
         from google.cloud.bigquery.table import Row
 
         # "Standard" SQL dialect uses 'INT64', 'FLOAT64', 'BOOL'.
-        candidate = _Field("REQUIRED", "candidate", "STRING")
-        votes = _Field("REQUIRED", "votes", "INT64")
-        percentage = _Field("REQUIRED", "percentage", "FLOAT64")
-        incumbent = _Field("REQUIRED", "incumbent", "BOOL")
+        candidate = _make_field("STRING", mode="REQUIRED", name="candidate")
+        votes = _make_field("INT64", mode="REQUIRED", name="votes")
+        percentage = _make_field("FLOAT64", mode="REQUIRED", name="percentage")
+        incumbent = _make_field("BOOL", mode="REQUIRED", name="incumbent")
         schema = [candidate, votes, percentage, incumbent]
         rows = [
             {"f": [{"v": "Phred Phlyntstone"}, {"v": 8}, {"v": 0.25}, {"v": "true"}]},
@@ -393,73 +376,104 @@ class Test_rows_from_json(unittest.TestCase):
         coerced = self._call_fut(rows, schema)
         self.assertEqual(coerced, expected)
 
+    def test_w_mapping_schema_resolves_schema_once(self):
+        from google.cloud.bigquery import schema as schema_module
+        from google.cloud.bigquery.table import Row
+
+        schema = [
+            {"name": "name", "type": "STRING", "mode": "REQUIRED"},
+            {"name": "age", "type": "INTEGER", "mode": "NULLABLE"},
+        ]
+        rows = [
+            {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+            {"f": [{"v": "Wylma Phlyntstone"}, {"v": None}]},
+        ]
+        f2i = {"name": 0, "age": 1}
+        expected = [
+            Row(("Phred Phlyntstone", 32), f2i),
+            Row(("Bharney Rhubble", 33), f2i),
+            Row(("Wylma Phlyntstone", None), f2i),
+        ]
+
+        with mock.patch.object(
+            schema_module,
+            "_to_schema_fields",
+            wraps=schema_module._to_schema_fields,
+        ) as to_schema_fields:
+            coerced = _rows_from_json(rows, schema)
+
+        self.assertEqual(coerced, expected)
+        to_schema_fields.assert_called_once()
+
 
 class Test_int_to_json(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _int_to_json
-
         return _int_to_json(value)
 
     def test_w_int(self):
         self.assertEqual(self._call_fut(123), "123")
 
-    def test_w_string(self):
-        self.assertEqual(self._call_fut("123"), "123")
+    def test_w_int_subclass(self):
+        class _Int(int):
+            pass
 
+        self.assertEqual(self._call_fut(_Int(123)), "123")
 
-class Test_float_to_json(unittest.TestCase):
-    def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _float_to_json
+    def test_w_string(self):
+        self.assertEqual(self._call_fut("123"), "123")
 
-        return _float_to_json(value)
 
+class Test_float_to_json:
     def test_w_none(self):
-        self.assertEqual(self._call_fut(None), None)
+        assert _float_to_json(None) is None
 
     def test_w_non_numeric(self):
-        with self.assertRaises(TypeError):
-            self._call_fut(object())
+        with pytest.raises(TypeError):
+            _float_to_json(object())
 
     def test_w_integer(self):
-        result = self._call_fut(123)
-        self.assertIsInstance(result, float)
-        self.assertEqual(result, 123.0)
-
-    def test_w_float(self):
-        self.assertEqual(self._call_fut(1.23), 1.23)
-
-    def test_w_float_as_string(self):
-        self.assertEqual(self._call_fut("1.23"), 1.23)
-
-    def test_w_nan(self):
-        result = self._call_fut(float("nan"))
-        self.assertEqual(result.lower(), "nan")
-
-    def test_w_nan_as_string(self):
-        result = self._call_fut("NaN")
-        self.assertEqual(result.lower(), "nan")
+        result = _float_to_json(123)
+        assert isinstance(result, float)
+        assert result == 123.0
 
-    def test_w_infinity(self):
-        result = self._call_fut(float("inf"))
-        self.assertEqual(result.lower(), "inf")
+    @pytest.mark.parametrize("value", [1.23, "1.23"], ids=["float", "string"])
+    def test_w_float(self, value):
+        assert _float_to_json(value) == 1.23
 
-    def test_w_infinity_as_string(self):
-        result = self._call_fut("inf")
-        self.assertEqual(result.lower(), "inf")
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (float("nan"), "nan"),
+            ("NaN", "nan"),
+            (float("inf"), "inf"),
+            ("inf", "inf"),
+            (float("-inf"), "-inf"),
+            ("-inf", "-inf"),
+        ],
+        ids=[
+            "nan",
+            "nan_as_string",
+            "infinity",
+            "infinity_as_string",
+            "negative_infinity",
+            "negative_infinity_as_string",
+        ],
+    )
+    def test_w_special_value(self, value, expected):
+        assert _float_to_json(value).lower() == expected
 
-    def test_w_negative_infinity(self):
-        result = self._call_fut(float("-inf"))
-        self.assertEqual(result.lower(), "-inf")
+    def test_w_decimal(self):
+        result = _float_to_json(decimal.Decimal("1.5"))
+        assert type(result) is float
+        assert result == 1.5
 
-    def test_w_negative_infinity_as_string(self):
-        result = self._call_fut("-inf")
-        self.assertEqual(result.lower(), "-inf")
+    def test_w_decimal_special_value(self):
+        assert _float_to_json(decimal.Decimal("NaN")) == "NaN"
 
 
 class Test_decimal_to_json(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _decimal_to_json
-
         return _decimal_to_json(value)
 
     def test_w_float(self):
@@ -471,11 +485,15 @@ class Test_decimal_to_json(unittest.TestCase):
     def test_w_decimal(self):
         self.assertEqual(self._call_fut(decimal.Decimal("1.23")), "1.23")
 
+    def test_w_decimal_subclass(self):
+        class _Decimal(decimal.Decimal):
+            pass
+
+        self.assertEqual(self._call_fut(_Decimal("1.23")), "1.23")
+
 
 class Test_bool_to_json(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _bool_to_json
-
         return _bool_to_json(value)
 
     def test_w_true(self):
@@ -490,8 +508,6 @@ class Test_bool_to_json(unittest.TestCase):
 
 class Test_bytes_to_json(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _bytes_to_json
-
         return _bytes_to_json(value)
 
     def test_w_non_bytes(self):
@@ -505,102 +521,98 @@ class Test_bytes_to_json(unittest.TestCase):
         self.assertEqual(converted, expected)
 
 
-class Test_timestamp_to_json_parameter(unittest.TestCase):
-    def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _timestamp_to_json_parameter
-
-        return _timestamp_to_json_parameter(value)
-
-    def test_w_float(self):
-        self.assertEqual(self._call_fut(1.234567), 1.234567)
-
-    def test_w_string(self):
-        ZULU = "2016-12-20 15:58:27.339328+00:00"
-        self.assertEqual(self._call_fut(ZULU), ZULU)
-
-    def test_w_datetime_wo_zone(self):
-        ZULU = "2016-12-20 15:58:27.339328+00:00"
-        when = datetime.datetime(2016, 12, 20, 15, 58, 27, 339328)
-        self.assertEqual(self._call_fut(when), ZULU)
+class Test_timestamp_to_json_parameter:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (1.234567, 1.234567),
+            (
+                "2016-12-20 15:58:27.339328+00:00",
+                "2016-12-20 15:58:27.339328+00:00",
+            ),
+            (
+                datetime.datetime(2016, 12, 20, 15, 58, 27, 339328),
+                "2016-12-20 15:58:27.339328+00:00",
+            ),
+        ],
+        ids=["float", "string", "datetime_wo_zone"],
+    )
+    def test_w_value(self, value, expected):
+        assert _timestamp_to_json_parameter(value) == expected
 
     def test_w_datetime_w_non_utc_zone(self):
-        class _Zone(datetime.tzinfo):
-            def utcoffset(self, _):
-                return datetime.timedelta(minutes=-240)
-
+        zone = datetime.timezone(datetime.timedelta(minutes=-240))
         ZULU = "2016-12-20 19:58:27.339328+00:00"
-        when = datetime.datetime(2016, 12, 20, 15, 58, 27, 339328, tzinfo=_Zone())
-        self.assertEqual(self._call_fut(when), ZULU)
+        when = datetime.datetime(2016, 12, 20, 15, 58, 27, 339328, tzinfo=zone)
+        assert _timestamp_to_json_parameter(when) == ZULU
 
     def test_w_datetime_w_utc_zone(self):
-        from google.cloud._helpers import UTC
-
         ZULU = "2016-12-20 15:58:27.339328+00:00"
         when = datetime.datetime(2016, 12, 20, 15, 58, 27, 339328, tzinfo=UTC)
-        self.assertEqual(self._call_fut(when), ZULU)
-
+        assert _timestamp_to_json_parameter(when) == ZULU
 
-class Test_timestamp_to_json_row(unittest.TestCase):
-    def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _timestamp_to_json_row
-
-        return _timestamp_to_json_row(value)
 
-    def test_w_float(self):
-        self.assertEqual(self._call_fut(1.234567), 1.234567)
-
-    def test_w_string(self):
-        ZULU = "2016-12-20 15:58:27.339328+00:00"
-        self.assertEqual(self._call_fut(ZULU), ZULU)
-
-    def test_w_datetime_no_zone(self):
-        when = datetime.datetime(2016, 12, 20, 15, 58, 27, 339328)
-        self.assertEqual(self._call_fut(when), "2016-12-20T15:58:27.339328Z")
+class Test_timestamp_to_json_row:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (1.234567, 1.234567),
+            (
+                "2016-12-20 15:58:27.339328+00:00",
+                "2016-12-20 15:58:27.339328+00:00",
+            ),
+            (
+                datetime.datetime(2016, 12, 20, 15, 58, 27, 339328),
+                "2016-12-20T15:58:27.339328Z",
+            ),
+        ],
+        ids=["float", "string", "datetime_no_zone"],
+    )
+    def test_w_value(self, value, expected):
+        assert _timestamp_to_json_row(value) == expected
 
     def test_w_datetime_w_utc_zone(self):
-        from google.cloud._helpers import UTC
-
         when = datetime.datetime(2020, 11, 17, 1, 6, 52, 353795, tzinfo=UTC)
-        self.assertEqual(self._call_fut(when), "2020-11-17T01:06:52.353795Z")
+        assert _timestamp_to_json_row(when) == "2020-11-17T01:06:52.353795Z"
 
     def test_w_datetime_w_non_utc_zone(self):
-        class EstZone(datetime.tzinfo):
-            def utcoffset(self, _):
-                return datetime.timedelta(minutes=-300)
-
-        when = datetime.datetime(2020, 11, 17, 1, 6, 52, 353795, tzinfo=EstZone())
-        self.assertEqual(self._call_fut(when), "2020-11-17T06:06:52.353795Z")
-
-
-class Test_datetime_to_json(unittest.TestCase):
-    def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _datetime_to_json
+        est_zone = datetime.timezone(datetime.timedelta(minutes=-300))
+        when = datetime.datetime(2020, 11, 17, 1, 6, 52, 353795, tzinfo=est_zone)
+        assert _timestamp_to_json_row(when) == "2020-11-17T06:06:52.353795Z"
 
-        return _datetime_to_json(value)
 
+class Test_datetime_to_json:
     def test_w_string(self):
         RFC3339 = "2016-12-03T14:14:51Z"
-        self.assertEqual(self._call_fut(RFC3339), RFC3339)
+        assert _datetime_to_json(RFC3339) == RFC3339
 
     def test_w_datetime(self):
-        from google.cloud._helpers import UTC
-
         when = datetime.datetime(2016, 12, 3, 14, 11, 27, 123456, tzinfo=UTC)
-        self.assertEqual(self._call_fut(when), "2016-12-03T14:11:27.123456")
+        assert _datetime_to_json(when) == "2016-12-03T14:11:27.123456"
 
     def test_w_datetime_w_non_utc_zone(self):
-        class EstZone(datetime.tzinfo):
-            def utcoffset(self, _):
-                return datetime.timedelta(minutes=-300)
+        est_zone = datetime.timezone(datetime.timedelta(minutes=-300))
+        when = datetime.datetime(2016, 12, 3, 14, 11, 27, 123456, tzinfo=est_zone)
+        assert _datetime_to_json(when) == "2016-12-03T19:11:27.123456"
+
+    def test_w_naive_datetime_wo_microseconds(self):
+        when = datetime.datetime(2016, 12, 3, 14, 11, 27)
+        assert _datetime_to_json(when) == "2016-12-03T14:11:27.000000"
+
+    def test_w_early_year(self):
+        when = datetime.datetime(12, 1, 2, 3, 4, 5, 6)
+        assert _datetime_to_json(when) == "0012-01-02T03:04:05.000006"
+
+    def test_w_datetime_subclass(self):
+        class _Datetime(datetime.datetime):
+            pass
 
-        when = datetime.datetime(2016, 12, 3, 14, 11, 27, 123456, tzinfo=EstZone())
-        self.assertEqual(self._call_fut(when), "2016-12-03T19:11:27.123456")
+        when = _Datetime(2016, 12, 3, 14, 11, 27, 123456)
+        assert _datetime_to_json(when) == "2016-12-03T14:11:27.123456"
 
 
 class Test_date_to_json(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _date_to_json
-
         return _date_to_json(value)
 
     def test_w_string(self):
@@ -614,8 +626,6 @@ class Test_date_to_json(unittest.TestCase):
 
 class Test_time_to_json(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _time_to_json
-
         return _time_to_json(value)
 
     def test_w_string(self):
@@ -634,8 +644,12 @@ def _make_field(
     fields=(),
     range_element_type=None,
 ):
-    from google.cloud.bigquery.schema import SchemaField
+    return _make_field_cached(field_type, mode, name, tuple(fields), range_element_type)
+
 
+@functools.lru_cache(maxsize=None)
+def _make_field_cached(field_type, mode, name, fields, range_element_type):
+    # SchemaField exposes no setters, so tests can safely share instances.
     return SchemaField(
         name=name,
         field_type=field_type,
@@ -647,19 +661,15 @@ def _make_field(
 
 class Test_scalar_field_to_json(unittest.TestCase):
     def _call_fut(self, field, value):
-        from google.cloud.bigquery._helpers import _scalar_field_to_json
-
         return _scalar_field_to_json(field, value)
 
     def test_w_unknown_field_type(self):
         field = _make_field("UNKNOWN")
         original = object()
-        with warnings.catch_warnings(record=True) as warned:
+        with pytest.warns(FutureWarning, match="'UNKNOWN'") as warned:
             converted = self._call_fut(field, original)
         self.assertIs(converted, original)
         self.assertEqual(len(warned), 1)
-        warning = warned[0]
-        self.assertTrue("UNKNOWN" in str(warning))
 
     def test_w_known_field_type(self):
         field = _make_field("INT64")
@@ -667,21 +677,15 @@ class Test_scalar_field_to_json(unittest.TestCase):
         converted = self._call_fut(field, original)
         self.assertEqual(converted, str(original))
 
-    def test_w_scalar_none(self):
-        import google.cloud.bigquery._helpers as module_under_test
 
-        scalar_types = module_under_test._SCALAR_VALUE_TO_JSON_ROW.keys()
-        for type_ in scalar_types:
-            field = _make_field(type_)
-            original = None
-            converted = self._call_fut(field, original)
-            self.assertIsNone(converted, msg=f"{type_} did not return None")
+@pytest.mark.parametrize("type_", sorted(_SCALAR_VALUE_TO_JSON_ROW))
+def test_scalar_field_to_json_w_scalar_none(type_):
+    field = _make_field(type_)
+    assert _scalar_field_to_json(field, None) is None
 
 
 class Test_single_field_to_json(unittest.TestCase):
     def _call_fut(self, field, value):
-        from google.cloud.bigquery._helpers import _single_field_to_json
-
         return _single_field_to_json(field, value)
 
     def test_w_none(self):
@@ -716,13 +720,11 @@ class Test_single_field_to_json(unittest.TestCase):
         field = _make_field("JSON")
         original = {"alpha": "abc", "num": [1, 2, 3]}
         converted = self._call_fut(field, original)
-        self.assertEqual(converted, json.dumps(original))
+        self.assertEqual(converted, '{"alpha": "abc", "num": [1, 2, 3]}')
 
 
 class Test_repeated_field_to_json(unittest.TestCase):
     def _call_fut(self, field, value):
-        from google.cloud.bigquery._helpers import _repeated_field_to_json
-
         return _repeated_field_to_json(field, value)
 
     def test_w_empty(self):
@@ -739,11 +741,28 @@ class Test_repeated_field_to_json(unittest.TestCase):
         self.assertEqual(converted, [str(value) for value in original])
         self.assertEqual(field.mode, "REPEATED")
 
+    def test_w_none_items(self):
+        field = _make_field("INT64", mode="REPEATED")
+        converted = self._call_fut(field, [42, None, 17])
+        self.assertEqual(converted, ["42", None, "17"])
+
+    def test_w_unknown_type_skips_none_items(self):
+        field = _make_field("UNKNOWN", mode="REPEATED")
+        with pytest.warns(FutureWarning, match="'UNKNOWN'") as warned:
+            converted = self._call_fut(field, [None, "abc"])
+        self.assertEqual(converted, [None, "abc"])
+        self.assertEqual(len(warned), 1)
+
+    def test_w_records_and_none(self):
+        subfield = _make_field("INT64", name="one", mode="NULLABLE")
+        field = _make_field("RECORD", mode="REPEATED", fields=[subfield])
+        original = [{"one": 42}, None, (17,)]
+        converted = self._call_fut(field, original)
+        self.assertEqual(converted, [{"one": "42"}, None, {"one": "17"}])
+
 
 class Test_record_field_to_json(unittest.TestCase):
     def _call_fut(self, field, value):
-        from google.cloud.bigquery._helpers import _record_field_to_json
-
         return _record_field_to_json(field, value)
 
     def test_w_empty(self):
@@ -847,8 +866,6 @@ class Test_record_field_to_json(unittest.TestCase):
 
 class Test_range_field_to_json(unittest.TestCase):
     def _call_fut(self, field, value):
-        from google.cloud.bigquery._helpers import _range_field_to_json
-
         return _range_field_to_json(field, value)
 
     def test_w_date(self):
@@ -882,8 +899,6 @@ class Test_range_field_to_json(unittest.TestCase):
         self.assertEqual(converted, expected)
 
     def test_w_timestamp(self):
-        from google.cloud._helpers import UTC
-
         field = _make_field("RANGE", range_element_type="TIMESTAMP")
         start = datetime.datetime(2016, 12, 3, 14, 11, 27, 123456, tzinfo=UTC)
         original = {"start": start}
@@ -891,6 +906,42 @@ class Test_range_field_to_json(unittest.TestCase):
         expected = {"start": "2016-12-03T14:11:27.123456Z", "end": None}
         self.assertEqual(converted, expected)
 
+    def test_w_repeated_bounds_in_different_zones(self):
+        field = _make_field("RANGE", range_element_type="DATE")
+        est_zone = datetime.timezone(datetime.timedelta(hours=-5))
+        utc_start = datetime.datetime(2016, 12, 3, tzinfo=UTC)
+        est_start = utc_start.astimezone(est_zone)
+        self.assertEqual(utc_start, est_start)
+
+        for _ in range(2):
+            self.assertEqual(
+                self._call_fut(field.range_element_type, {"start": utc_start}),
+                {"start": "2016-12-03T00:00:00+00:00", "end": None},
+            )
+            self.assertEqual(
+                self._call_fut(field.range_element_type, {"start": est_start}),
+                {"start": "2016-12-02T19:00:00-05:00", "end": None},
+            )
+
+    def test_w_repeated_bounds_w_ambiguous_wall_time(self):
+        from dateutil import tz
+
+        field = _make_field("RANGE", range_element_type="TIMESTAMP")
+        new_york = tz.gettz("America/New_York")
+        first = datetime.datetime(2021, 11, 7, 1, 30, tzinfo=new_york)
+        second = first.replace(fold=1)
+        self.assertEqual(first, second)
+
+        for _ in range(2):
+            self.assertEqual(
+                self._call_fut(field.range_element_type, {"start": first}),
+                {"start": "2021-11-07T05:30:00.000000Z", "end": None},
+            )
+            self.assertEqual(
+                self._call_fut(field.range_element_type, {"start": second}),
+                {"start": "2021-11-07T06:30:00.000000Z", "end": None},
+            )
+
     def test_w_timestamp_string(self):
         field = _make_field("RANGE", range_element_type="TIMESTAMP")
         original = {"start": "2016-12-03T14:11:27.123456Z"}
@@ -931,6 +982,18 @@ class Test_range_field_to_json(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._call_fut(field.range_element_type, original)
 
+    def test_w_literal_trailing_characters(self):
+        field = _make_field("RANGE", range_element_type="DATE")
+        original = "[2016-12-03, UNBOUNDED) "
+        with self.assertRaises(ValueError):
+            self._call_fut(field.range_element_type, original)
+
+    def test_w_literal_three_bounds(self):
+        field = _make_field("RANGE", range_element_type="DATE")
+        original = "[2016-12-03, 2017-12-03, 2018-12-03)"
+        with self.assertRaisesRegex(ValueError, "has incorrect format"):
+            self._call_fut(field.range_element_type, original)
+
     def test_w_unsupported_representation(self):
         field = _make_field("RANGE", range_element_type="DATE")
         with self.assertRaises(ValueError):
@@ -939,8 +1002,6 @@ class Test_range_field_to_json(unittest.TestCase):
 
 class Test_field_to_json(unittest.TestCase):
     def _call_fut(self, field, value):
-        from google.cloud.bigquery._helpers import _field_to_json
-
         return _field_to_json(field, value)
 
     def test_w_none(self):
@@ -980,8 +1041,6 @@ class Test_field_to_json(unittest.TestCase):
 
 class Test_snake_to_camel_case(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _snake_to_camel_case
-
         return _snake_to_camel_case(value)
 
     def test_w_snake_case_string(self):
@@ -993,8 +1052,6 @@ class Test_snake_to_camel_case(unittest.TestCase):
 
 class Test__get_sub_prop(unittest.TestCase):
     def _call_fut(self, container, keys, **kw):
-        from google.cloud.bigquery._helpers import _get_sub_prop
-
         return _get_sub_prop(container, keys, **kw)
 
     def test_w_empty_container_default_default(self):
@@ -1016,11 +1073,14 @@ class Test__get_sub_prop(unittest.TestCase):
     def test_w_matching_first_key_matching_second_key(self):
         self.assertEqual(self._call_fut({"key1": {"key2": 2}}, ["key1", "key2"]), 2)
 
+    def test_w_non_dict_intermediate_value(self):
+        self.assertEqual(
+            self._call_fut({"key1": [1]}, ["key1", "key2"], default="dflt"), "dflt"
+        )
+
 
 class Test__set_sub_prop(unittest.TestCase):
     def _call_fut(self, container, keys, value):
-        from google.cloud.bigquery._helpers import _set_sub_prop
-
         return _set_sub_prop(container, keys, value)
 
     def test_w_empty_container_single_key_in_sequence(self):
@@ -1051,8 +1111,6 @@ class Test__set_sub_prop(unittest.TestCase):
 
 class Test__del_sub_prop(unittest.TestCase):
     def _call_fut(self, container, keys):
-        from google.cloud.bigquery._helpers import _del_sub_prop
-
         return _del_sub_prop(container, keys)
 
     def test_w_single_key(self):
@@ -1060,6 +1118,11 @@ class Test__del_sub_prop(unittest.TestCase):
         self._call_fut(container, ["key1"])
         self.assertEqual(container, {})
 
+    def test_w_single_string_key(self):
+        container = {"key1": "value", "key2": "other"}
+        self._call_fut(container, "key1")
+        self.assertEqual(container, {"key2": "other"})
+
     def test_w_empty_container_nested_keys(self):
         container = {}
         self._call_fut(container, ["key1", "key2", "key3"])
@@ -1073,8 +1136,6 @@ class Test__del_sub_prop(unittest.TestCase):
 
 class Test__int_or_none(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _int_or_none
-
         return _int_or_none(value)
 
     def test_w_num_string(self):
@@ -1093,8 +1154,6 @@ class Test__int_or_none(unittest.TestCase):
 
 class Test__str_or_none(unittest.TestCase):
     def _call_fut(self, value):
-        from google.cloud.bigquery._helpers import _str_or_none
-
         return _str_or_none(value)
 
     def test_w_int(self):
@@ -1107,43 +1166,6 @@ class Test__str_or_none(unittest.TestCase):
         self.assertEqual(self._call_fut("ham"), "ham")
 
 
-class _Field(object):
-    def __init__(
-        self,
-        mode,
-        name="unknown",
-        field_type="UNKNOWN",
-        fields=(),
-        range_element_type=None,
-        element_type=None,
-    ):
-        self.mode = mode
-        self.name = name
-        self.field_type = field_type
-        self.fields = fields
-        self.range_element_type = range_element_type
-        self.element_type = element_type
-
-
-def _field_isinstance_patcher():
-    """A patcher thank makes _Field instances seem like SchemaField instances."""
-    from google.cloud.bigquery.schema import SchemaField
-
-    def fake_isinstance(instance, target_class):
-        if instance.__class__.__name__ != "_Field":
-            return isinstance(instance, target_class)  # pragma: NO COVER
-
-        # pretend that _Field() instances are actually instances of SchemaField
-        return target_class is SchemaField or (
-            isinstance(target_class, tuple) and SchemaField in target_class
-        )
-
-    patcher = mock.patch(
-        "google.cloud.bigquery.schema.isinstance", side_effect=fake_isinstance
-    )
-    return patcher
-
-
 def test_decimal_as_float_api_repr():
     """Make sure decimals get converted to float."""
     import google.cloud.bigquery.query
@@ -1162,21 +1184,15 @@ def test_decimal_as_float_api_repr():
 class Test__get_bigquery_host(unittest.TestCase):
     @staticmethod
     def _call_fut():
-        from google.cloud.bigquery._helpers import _get_bigquery_host
-
         return _get_bigquery_host()
 
     def test_wo_env_var(self):
-        from google.cloud.bigquery._helpers import _DEFAULT_HOST
-
         with mock.patch("os.environ", {}):
             host = self._call_fut()
 
         self.assertEqual(host, _DEFAULT_HOST)
 
     def test_w_env_var(self):
-        from google.cloud.bigquery._helpers import BIGQUERY_EMULATOR_HOST
-
         HOST = "https://api.example.com"
 
         with mock.patch("os.environ", {BIGQUERY_EMULATOR_HOST: HOST}):
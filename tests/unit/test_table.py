@@ -6696,3 +6696,58 @@ def test_to_dataframe_iterable_w_bqstorage_max_stream_count(preserve_order):
         read_session=mock.ANY,
         max_stream_count=max_stream_count if not preserve_order else 1,
     )
+
+
+def test_row_iterator_page_columns_w_int64_float64_bool():
+    from google.cloud.bigquery import schema
+    from google.cloud.bigquery import table as mut
+
+    # Pages downloaded for pandas and pyarrow are decoded column by column,
+    # skipping the per-row tuples and Row objects of the row-oriented path.
+    page_schema = [
+        schema.SchemaField("candidate", "STRING", mode="REQUIRED"),
+        schema.SchemaField("votes", "INT64", mode="REQUIRED"),
+        schema.SchemaField("percentage", "FLOAT64", mode="REQUIRED"),
+        schema.SchemaField("incumbent", "BOOL", mode="NULLABLE"),
+    ]
+    response = {
+        "rows": [
+            {
+                "f": [
+                    {"v": "Phred Phlyntstone"},
+                    {"v": "8"},
+                    {"v": "0.25"},
+                    {"v": "true"},
+                ]
+            },
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "4"}, {"v": "0.125"}, {"v": None}]},
+            {
+                "f": [
+                    {"v": "Wylma Phlyntstone"},
+                    {"v": "20"},
+                    {"v": "0.625"},
+                    {"v": "false"},
+                ]
+            },
+        ]
+    }
+
+    columns = mut._row_iterator_page_columns(page_schema, response)
+
+    assert [list(column) for column in columns] == [
+        ["Phred Phlyntstone", "Bharney Rhubble", "Wylma Phlyntstone"],
+        [8, 4, 20],
+        [0.25, 0.125, 0.625],
+        [True, None, False],
+    ]
+
+
+def test_row_iterator_page_columns_wo_rows():
+    from google.cloud.bigquery import schema
+    from google.cloud.bigquery import table as mut
+
+    page_schema = [schema.SchemaField("col", "STRING")]
+
+    columns = mut._row_iterator_page_columns(page_schema, {})
+
+    assert [list(column) for column in columns] == [[]]